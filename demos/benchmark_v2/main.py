@@ -19,14 +19,17 @@ Run via serial for full output capture:
 import time
 import gc
 import supervisor
+from micropython import const
+
+# Separator lines (built once, referenced by every banner)
+_EQLINE = "=" * 60
+_DASHLINE = "-" * 60
+_STARLINE = "*" * 60
 
 # =============================================================================
 # Boot Benchmarks - measure import costs and init timing
 # =============================================================================
-print()
-print("=" * 60)
-print("  BOOT BENCHMARKS (lib_v2)")
-print("=" * 60)
+print("\n" + _EQLINE + "\n  BOOT BENCHMARKS (lib_v2)\n" + _EQLINE)
 
 gc.collect()
 _mem_start = gc.mem_free()
@@ -66,19 +69,18 @@ print(f"  framebuffer import:            {(_t1-_t0)/1e6:>10.2f} ms  |  {_mem_bef
 gc.collect()
 _mem_before = gc.mem_free()
 _t0 = time.monotonic_ns()
-from utils import BENCHMARK_VERSION, mem_free, print_header, print_metric
+from utils import BENCHMARK_VERSION, mem_free, print_header, print_metric_f, print_metric_i
 _t1 = time.monotonic_ns()
 gc.collect()
 _mem_after = gc.mem_free()
 print(f"  utils import:                  {(_t1-_t0)/1e6:>10.2f} ms  |  {_mem_before - _mem_after:>6} bytes")
 
-print("-" * 60)
+print(_DASHLINE)
 gc.collect()
 _mem_after_imports = gc.mem_free()
 print(f"  Total import cost:                           |  {_mem_start - _mem_after_imports:>6} bytes")
-print(f"  Free RAM after imports:        {_mem_after_imports:>10} bytes")
-print("=" * 60)
-print()
+print(f"  Free RAM after imports:        {_mem_after_imports:>10} bytes\n"
+      + _EQLINE + "\n")
 
 # Benchmark modules to load on demand
 BENCHMARKS = [
@@ -94,13 +96,17 @@ BENCHMARKS = [
 ]
 
 # Serial command characters for headless mode
-SERIAL_CMD_RUN_ALL = ord('r')
-SERIAL_CMD_QUIT = ord('q')
+# (const() needs a literal, so these are the ord() values of 'r' and 'q')
+_CMD_RUN_ALL = const(0x72)  # 'r'
+_CMD_QUIT = const(0x71)     # 'q'
+
+# Display constants (underscore + const() folds them into the bytecode)
+_MENU_START_Y = const(20)
+_LINE_HEIGHT = const(18)
+_VISIBLE_ITEMS = const(5)
 
-# Display constants
-MENU_START_Y = 20
-LINE_HEIGHT = 18
-VISIBLE_ITEMS = 5
+# Buttons accepted by the menu loop (tuple: no per-iteration allocation)
+_NAV_BUTTONS = (Buttons.A, Buttons.B, Buttons.D)
 
 
 class BenchmarkMenu:
@@ -131,13 +137,13 @@ class BenchmarkMenu:
         self.canvas.hline(10, 16, self.canvas.width - 20, BLACK)
 
         # Menu items
-        visible_count = min(len(self.items), VISIBLE_ITEMS)
+        visible_count = min(len(self.items), _VISIBLE_ITEMS)
         for i in range(visible_count):
             item_idx = self.scroll_offset + i
             if item_idx >= len(self.items):
                 break
 
-            y = MENU_START_Y + i * LINE_HEIGHT
+            y = _MENU_START_Y + i * _LINE_HEIGHT
             name = self.items[item_idx][0]
 
             if item_idx == self.cursor:
@@ -159,8 +165,8 @@ class BenchmarkMenu:
     def move_down(self):
         if self.cursor < len(self.items) - 1:
             self.cursor += 1
-            if self.cursor >= self.scroll_offset + VISIBLE_ITEMS:
-                self.scroll_offset = self.cursor - VISIBLE_ITEMS + 1
+            if self.cursor >= self.scroll_offset + _VISIBLE_ITEMS:
+                self.scroll_offset = self.cursor - _VISIBLE_ITEMS + 1
 
     def get_selected(self):
         return self.items[self.cursor]
@@ -168,7 +174,7 @@ class BenchmarkMenu:
     def wait_for_selection(self):
         """Wait for user input. Returns selected item on D."""
         while True:
-            btn = self.btns.wait([Buttons.A, Buttons.B, Buttons.D])
+            btn = self.btns.wait(_NAV_BUTTONS)
 
             if btn == Buttons.A:
                 self.move_up()
@@ -190,10 +196,7 @@ def run_single_benchmark(name, module_name, func_name, canvas, buttons=None):
         canvas: Canvas instance
         buttons: Optional Buttons instance for interactive mode
     """
-    print()
-    print("*" * 60)
-    print(f"  Running: {name}")
-    print("*" * 60)
+    print("\n" + _STARLINE + "\n  Running: " + name + "\n" + _STARLINE)
 
     try:
         module = __import__(module_name)
@@ -211,13 +214,12 @@ def run_single_benchmark(name, module_name, func_name, canvas, buttons=None):
 
 def run_all_benchmarks(canvas):
     """Run all benchmarks in sequence."""
-    print()
-    print("*" * 60)
-    print("  lib_v2 Benchmark Suite")
-    print(f"  Version: {BENCHMARK_VERSION}")
-    print("  " + "=" * 40)
-    print(f"  Free RAM: {mem_free()} bytes")
-    print("*" * 60)
+    print("\n" + _STARLINE
+          + "\n  lib_v2 Benchmark Suite"
+          + f"\n  Version: {BENCHMARK_VERSION}"
+          + "\n  " + "=" * 40
+          + f"\n  Free RAM: {mem_free()} bytes\n"
+          + _STARLINE)
 
     start_time = time.monotonic()
 
@@ -230,27 +232,23 @@ def run_all_benchmarks(canvas):
     # Memory diagnostics
     print_header("MEMORY DIAGNOSTICS")
     gc.collect()
-    print_metric("Free RAM", mem_free(), "bytes")
+    print_metric_i("Free RAM", mem_free(), "bytes")
 
     # Buffer sizes
     fb = canvas._fb
-    print_metric("Framebuffer size", len(canvas.buffer), "bytes")
-    print_metric("Framebuffer depth", fb.depth, "bpp")
-    print_metric("Display dimensions", f"{fb._phys_w}x{fb._phys_h}", "px")
-    print_metric("Logical dimensions", f"{canvas.width}x{canvas.height}", "px")
-    print_metric("Rotation", fb.rotation, "deg")
+    print_metric_i("Framebuffer size", len(canvas.buffer), "bytes")
+    print_metric_i("Framebuffer depth", fb.depth, "bpp")
+    print_metric_i("Display dimensions", f"{fb._phys_w}x{fb._phys_h}", "px")
+    print_metric_i("Logical dimensions", f"{canvas.width}x{canvas.height}", "px")
+    print_metric_i("Rotation", fb.rotation, "deg")
 
     # Summary
     total_time = time.monotonic() - start_time
     print_header("SUMMARY")
-    print_metric("Total benchmark time", total_time, "sec")
-    print_metric("Final free RAM", mem_free(), "bytes")
+    print_metric_f("Total benchmark time", total_time, "sec")
+    print_metric_i("Final free RAM", mem_free(), "bytes")
 
-    print()
-    print("*" * 60)
-    print("  Benchmark Complete")
-    print("*" * 60)
-    print()
+    print("\n" + _STARLINE + "\n  Benchmark Complete\n" + _STARLINE + "\n")
 
 
 def show_running_screen(canvas, name):
@@ -310,6 +308,13 @@ def main():
     print(f"Benchmark Suite v{BENCHMARK_VERSION}")
     print("Initializing hardware...")
 
+    # Trigger a collection after every ~1/4 heap of allocations so GC runs
+    # as small, predictable pauses instead of one long in-allocation
+    # collection landing inside a timed benchmark.
+    if hasattr(gc, "threshold"):
+        gc.collect()
+        gc.threshold(gc.mem_free() // 4)
+
     # ==========================================================================
     # Hardware initialization benchmarks
     # ==========================================================================
@@ -318,6 +323,7 @@ def main():
 
     # Load default font
     _bench_init("load_font():", lambda: canvas.load_font("/lib/fonts/cozette.bf2"))
+    _bench_init("prewarm_font():", canvas.prewarm_font)
 
     # Initial display
     canvas.clear()
@@ -326,11 +332,10 @@ def main():
     t1 = time.monotonic_ns()
     print(f"  Initial full refresh:          {(t1-t0)/1e6:>10.2f} ms")
 
-    print("-" * 60)
     gc.collect()
-    print(f"  Free RAM ready for menu:       {gc.mem_free():>10} bytes")
-    print("=" * 60)
-    print()
+    print(_DASHLINE
+          + f"\n  Free RAM ready for menu:       {gc.mem_free():>10} bytes\n"
+          + _EQLINE + "\n")
 
     # Drain any buffered serial input from reboot
     drain_serial()
@@ -342,14 +347,14 @@ def main():
 
         # Check for serial command before waiting for buttons
         cmd = check_serial_command()
-        if cmd == SERIAL_CMD_RUN_ALL:
+        if cmd == _CMD_RUN_ALL:
             print("[SERIAL] Received 'r' - running all benchmarks (headless mode)")
             show_running_screen(canvas, "All Benchmarks")
             run_all_benchmarks(canvas)
             show_complete_screen(canvas, btns, headless=True)
             print("[SERIAL] Headless run complete. Exiting.")
             return
-        elif cmd == SERIAL_CMD_QUIT:
+        elif cmd == _CMD_QUIT:
             print("[SERIAL] Received 'q' - exiting")
             return
 
@@ -9,6 +9,10 @@ import time
 
 BENCHMARK_VERSION = "2.0.0-v2"
 
+# Separator lines (built once, referenced by every header)
+_EQLINE = "=" * 60
+_DASHLINE = "-" * 60
+
 
 def mem_free() -> int:
     """Get free memory in bytes."""
@@ -25,8 +29,16 @@ def timed(func, *args, **kwargs):
     return result, elapsed
 
 
-def avg_timed(func, iterations, *args, **kwargs):
-    """Run function N times and return average time in ms."""
+def avg_timed(func, iterations, *args, warmup=0, **kwargs):
+    """Run function N times and return average time in ms.
+
+    A single gc.collect() runs before the timed loop; it is not free
+    (it scans the whole heap), so don't add collections inside the loop.
+    Use ``warmup`` to run untimed iterations first (fills caches, triggers
+    lazy init) before collecting and measuring.
+    """
+    for _ in range(warmup):
+        func(*args, **kwargs)
     gc.collect()
     total = 0
     for _ in range(iterations):
@@ -37,23 +49,34 @@ def avg_timed(func, iterations, *args, **kwargs):
 
 
 def print_header(title: str) -> None:
-    """Print section header."""
-    print()
-    print("=" * 60)
-    print(f"  {title}")
-    print("=" * 60)
+    """Print section header (single write to keep USB CDC traffic batched)."""
+    print("\n" + _EQLINE + "\n  " + title + "\n" + _EQLINE)
+
+
+def print_metric_f(name: str, value: float, unit: str = "ms") -> None:
+    """Print a float metric (2 decimal places)."""
+    print(f"  {name:<40} {value:>10.2f} {unit}")
+
+
+def print_metric_i(name: str, value: int | str, unit: str = "ms") -> None:
+    """Print an int or preformatted string metric."""
+    print(f"  {name:<40} {value:>10} {unit}")
 
 
 def print_metric(name: str, value: float | int | str, unit: str = "ms") -> None:
-    """Print a metric in consistent format."""
+    """Print a metric in consistent format.
+
+    Dispatches on type; call print_metric_f/print_metric_i directly when
+    the type is known to skip the isinstance() check.
+    """
     if isinstance(value, float):
-        print(f"  {name:<40} {value:>10.2f} {unit}")
+        print_metric_f(name, value, unit)
     else:
-        print(f"  {name:<40} {value:>10} {unit}")
+        print_metric_i(name, value, unit)
 
 
 def print_separator() -> None:
-    print("-" * 60)
+    print(_DASHLINE)
 
 
 def print_subheader(text: str) -> None:
@@ -10,6 +10,28 @@ Multi-page demo with internal navigation:
 import time
 from buttons import Buttons
 
+# =============================================================================
+# Static Layout Data
+# =============================================================================
+
+# 3x3 alignment grid for demo_text_box: (col, row, align, valign, label)
+# Built once at import so each page draw is a single flat tuple scan.
+_TEXT_BOX_CELLS = tuple(
+    (col, row, align, valign, f"{align[0]}/{valign[0]}")
+    for row, valign in enumerate(("top", "middle", "bottom"))
+    for col, align in enumerate(("left", "center", "right"))
+)
+
+# Buttons accepted by show_and_wait (tuple: no per-iteration allocation)
+_NAV_BUTTONS = (Buttons.A, Buttons.B, Buttons.D)
+
+# Sample strings for the wrapping demos (interned once at import)
+_WRAP_SAMPLE = "The quick brown fox jumps over the lazy dog."
+_WRAP_BOX_CENTER = ("This demonstrates wrapped text inside a box horizontally "
+                    "centered and vertically middle-aligned within the box.")
+_WRAP_BOX_LEFT = ("This demonstrates wrapped text inside a box left-aligned "
+                  "and starts at the top of the box.")
+
 # =============================================================================
 # Navigation Helpers
 # =============================================================================
@@ -26,7 +48,7 @@ def show_and_wait(canvas, btns, mode="partial"):
     print("  [A]=Prev  [D]=Next  [B]=Exit")
 
     while True:
-        btn = btns.wait([Buttons.A, Buttons.B, Buttons.D])
+        btn = btns.wait(_NAV_BUTTONS)
         if btn == Buttons.A:
             return -1
         elif btn == Buttons.D:
@@ -65,19 +87,17 @@ def demo_text_wrapping(canvas):
     canvas.text("TEXT WRAPPING", canvas.width // 2, 2, align="center")
     canvas.hline(0, 16, canvas.width)
 
-    long_text = "The quick brown fox jumps over the lazy dog."
-
     # Left-aligned wrapped
     canvas.rect(5, 20, 140, 50)
-    canvas.text(long_text, 8, 23, max_width=134)
+    canvas.text(_WRAP_SAMPLE, 8, 23, max_width=134)
 
     # Center-aligned wrapped
     canvas.rect(150, 20, 140, 50)
-    canvas.text(long_text, 153, 23, max_width=134, align="center")
+    canvas.text(_WRAP_SAMPLE, 153, 23, max_width=134, align="center")
 
     # Right-aligned wrapped
     canvas.rect(5, 75, 140, 50)
-    canvas.text(long_text, 8, 78, max_width=134, align="right")
+    canvas.text(_WRAP_SAMPLE, 8, 78, max_width=134, align="right")
 
     # Labels
     canvas.text("left", 75, 58, align="center")
@@ -96,16 +116,12 @@ def demo_text_box(canvas):
     start_x, start_y = 5, 20
     gap = 3
 
-    aligns = ["left", "center", "right"]
-    valigns = ["top", "middle", "bottom"]
-
-    for row, valign in enumerate(valigns):
-        for col, align in enumerate(aligns):
-            bx = start_x + col * (box_w + gap)
-            by = start_y + row * (box_h + gap)
-            canvas.rect(bx, by, box_w, box_h)
-            canvas.text_box(f"{align[0]}/{valign[0]}", bx, by, box_w, box_h,
-                           align=align, valign=valign)
+    for col, row, align, valign, label in _TEXT_BOX_CELLS:
+        bx = start_x + col * (box_w + gap)
+        by = start_y + row * (box_h + gap)
+        canvas.rect(bx, by, box_w, box_h)
+        canvas.text_box(label, bx, by, box_w, box_h,
+                       align=align, valign=valign)
 
 
 def demo_shapes(canvas):
@@ -161,24 +177,43 @@ def demo_inverted(canvas):
 
 
 def demo_animation(canvas):
-    """Demo 6: Animation / Rapid Updates"""
+    """Demo 6: Animation / Rapid Updates
+
+    Static elements (title, bar outline) are drawn once; each frame only
+    touches the newly filled slice of the bar and the two changing labels,
+    then pushes just those regions to the panel.
+    """
     import time
-    for i in range(5):
-        canvas.clear()
-        canvas.text("ANIMATION", canvas.width // 2, 2, align="center")
 
-        # Moving progress bar
+    # Region updates need x/y/w/h on 8px boundaries
+    bar_region = (16, 24, 264, 48)    # Progress bar + percentage label
+    label_region = (80, 72, 136, 40)  # "Frame i/5" counter
+
+    # Static content, drawn once
+    canvas.clear()
+    canvas.text("ANIMATION", canvas.width // 2, 2, align="center")
+    canvas.rect(20, 30, 256, 20)
+
+    old_w = 0
+    for i in range(5):
+        # Moving progress bar: fill only the newly covered slice
         progress = (i + 1) * 20
-        canvas.rect(20, 30, 256, 20)
-        canvas.fill_rect(22, 32, int(252 * progress / 100), 16)
-        canvas.text(f"{progress}%", canvas.width // 2, 55, align="center")
+        new_w = int(252 * progress / 100)
+        canvas.fill_rect(22 + old_w, 32, new_w - old_w, 16)
+        old_w = new_w
 
-        # Counter
+        # Overwrite the changing labels in place
+        canvas.fill_rect(100, 54, 96, 16, black=False)
+        canvas.text(f"{progress}%", canvas.width // 2, 55, align="center")
+        canvas.fill_rect(label_region[0], 78, label_region[2], 30, black=False)
         canvas.text(f"Frame {i + 1}/5", canvas.width // 2, 80,
                    align="center", scale=2)
 
         start = time.monotonic()
-        canvas.update()
+        if i == 0:
+            canvas.update()  # Replace previous page once
+        else:
+            canvas.update_regions([bar_region, label_region])
         print(f"  Frame {i + 1}: {time.monotonic() - start:.2f}s")
         time.sleep(0.5)
 
@@ -197,13 +232,13 @@ def demo_wrapped_box(canvas):
 
     # Center-aligned, middle
     canvas.rect(10, 20, 135, 105)
-    canvas.text_box("This demonstrates wrapped text inside a box horizontally centered and vertically middle-aligned within the box.",
-                   15, 20, 125, 105, align="center", valign="middle", wrap=True)
+    canvas.text_box(_WRAP_BOX_CENTER, 15, 20, 125, 105,
+                   align="center", valign="middle", wrap=True)
 
     # Left-aligned, top
     canvas.rect(150, 20, 135, 105)
-    canvas.text_box("This demonstrates wrapped text inside a box left-aligned and starts at the top of the box.",
-                   155, 20, 125, 105, align="left", valign="top", wrap=True)
+    canvas.text_box(_WRAP_BOX_LEFT, 155, 20, 125, 105,
+                   align="left", valign="top", wrap=True)
 
 
 # =============================================================================
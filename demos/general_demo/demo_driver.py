@@ -15,6 +15,102 @@ import time
 import shapes
 
 
+def _report(total_times, refresh_times, note=""):
+    """Print per-run timings and the average in one write; return the averages.
+
+    Called after the timed loop so serial output never lands inside a
+    measurement (USB-CDC print can block until the host drains it).
+    """
+    avg_total = sum(total_times) / len(total_times)
+    avg_refresh = sum(refresh_times) / len(refresh_times)
+    lines = [f"  Run {i + 1}: {t:.2f}s total, {r:.2f}s refresh{note}"
+             for i, (t, r) in enumerate(zip(total_times, refresh_times))]
+    lines.append(f"  Average: {avg_total:.2f}s total, {avg_refresh:.2f}s refresh")
+    print("\n".join(lines))
+    return avg_total, avg_refresh
+
+
+def _stripe_pattern(fb, period, stripe_w, black=True):
+    """Return a copy of fb.buffer with full-height stripes every `period` px.
+
+    Equivalent to fill_rect(fb, x, 0, stripe_w, fb.height) for each stripe,
+    but tiled from physical lines: with a swapped rotation each stripe is a
+    band of whole physical rows, otherwise one physical row mask is built
+    and repeated for every row.
+    """
+    buf, phys_w, phys_h, stride, rotation_info, effective = fb.get_blit_context(black)
+    out = bytearray(buf)
+    bands = [fb.transform_region(x, 0, min(stripe_w, fb.width - x), fb.height)
+             for x in range(0, fb.width, period)]
+
+    if rotation_info[0]:
+        ink_row = bytes([0x00 if effective else 0xFF]) * stride
+        for _, py, _, ph in bands:
+            out[py * stride:(py + ph) * stride] = ink_row * ph
+    else:
+        row = out[:stride]
+        for px, _, pw, _ in bands:
+            for bx in range(px, px + pw):
+                if effective:
+                    row[bx >> 3] &= ~(0x80 >> (bx & 7))
+                else:
+                    row[bx >> 3] |= 0x80 >> (bx & 7)
+        out[:] = row * phys_h
+    return out
+
+
+_SUMMARY_ROWS = (("Full:", 'full'),
+                 ("Partial:", 'partial'),
+                 ("Region:", 'region'),
+                 ("Multi (3x):", 'multi'),
+                 ("Fast:", 'fast'))
+_summary_chrome = None  # (inverted, buffer snapshot) of the static layout
+
+
+def _draw_summary_chrome(canvas):
+    """Clear and draw the static parts of the summary (titles, labels, rules)."""
+    width = canvas.width
+    canvas.clear()
+    canvas.text("REFRESH BENCHMARKS", width // 2, 2, align="center")
+    canvas.hline(10, 16, width - 20)
+
+    canvas.text("Mode", 10, 20)
+    canvas.text("Total", 150, 20)
+    canvas.text("Busy", 220, 20)
+
+    y = 36
+    for label, _ in _SUMMARY_ROWS:
+        canvas.text(label, 10, y)
+        y += 16
+
+    canvas.hline(10, y + 2, width - 20)
+    canvas.text("Press any button", width // 2, y + 8, align="center")
+
+
+def _draw_summary(canvas, timings):
+    """Draw the benchmark summary into the framebuffer.
+
+    Only the timing cells change between runs: the rest of the screen is
+    drawn once, snapshotted, and restored with a single buffer copy.
+    """
+    global _summary_chrome
+    buf = canvas.buffer
+    inverted = canvas._fb.is_inverted
+    chrome = _summary_chrome
+    if chrome is None or chrome[0] != inverted:
+        _draw_summary_chrome(canvas)
+        _summary_chrome = (inverted, bytes(buf))
+    else:
+        buf[:] = chrome[1]
+
+    y = 36
+    for _, key in _SUMMARY_ROWS:
+        total_t, refresh_t = timings[key]
+        canvas.text(f"{total_t:.2f}s", 150, y)
+        canvas.text(f"{refresh_t:.2f}s", 220, y)
+        y += 16
+
+
 def run(canvas, btns=None):
     """Run driver refresh mode demonstration."""
     epd = canvas.epd
@@ -38,12 +134,8 @@ def run(canvas, btns=None):
         total_t = time.monotonic() - start
         total_times.append(total_t)
         refresh_times.append(refresh_t)
-        print(f"  Run {i + 1}: {total_t:.2f}s total, {refresh_t:.2f}s refresh")
 
-    avg_total = sum(total_times) / len(total_times)
-    avg_refresh = sum(refresh_times) / len(refresh_times)
-    timings['full'] = (avg_total, avg_refresh)
-    print(f"  Average: {avg_total:.2f}s total, {avg_refresh:.2f}s refresh")
+    timings['full'] = _report(total_times, refresh_times)
 
     # Test 2: Partial refresh benchmark
     print("\nPartial refresh benchmark (9 iterations)...")
@@ -61,12 +153,8 @@ def run(canvas, btns=None):
         total_t = time.monotonic() - start
         total_times.append(total_t)
         refresh_times.append(refresh_t)
-        print(f"  Run {i + 1}: {total_t:.2f}s total, {refresh_t:.2f}s refresh")
 
-    avg_total = sum(total_times) / len(total_times)
-    avg_refresh = sum(refresh_times) / len(refresh_times)
-    timings['partial'] = (avg_total, avg_refresh)
-    print(f"  Average: {avg_total:.2f}s total, {avg_refresh:.2f}s refresh")
+    timings['partial'] = _report(total_times, refresh_times)
 
     # Test 3: Region partial refresh benchmark
     print("\nRegion partial refresh benchmark (9 iterations)...")
@@ -93,12 +181,8 @@ def run(canvas, btns=None):
         total_t = time.monotonic() - start
         total_times.append(total_t)
         refresh_times.append(refresh_t)
-        print(f"  Run {i + 1}: {total_t:.2f}s total, {refresh_t:.2f}s refresh")
 
-    avg_total = sum(total_times) / len(total_times)
-    avg_refresh = sum(refresh_times) / len(refresh_times)
-    timings['region'] = (avg_total, avg_refresh)
-    print(f"  Average: {avg_total:.2f}s total, {avg_refresh:.2f}s refresh")
+    timings['region'] = _report(total_times, refresh_times)
 
     # Test 4: Multi-region batch refresh benchmark
     print("\nMulti-region batch refresh benchmark (4 iterations)...")
@@ -130,33 +214,28 @@ def run(canvas, btns=None):
         total_t = time.monotonic() - start
         total_times.append(total_t)
         refresh_times.append(refresh_t)
-        print(f"  Run {i + 1}: {total_t:.2f}s total, {refresh_t:.2f}s refresh (3 regions)")
 
-    avg_total = sum(total_times) / len(total_times)
-    avg_refresh = sum(refresh_times) / len(refresh_times)
-    timings['multi'] = (avg_total, avg_refresh)
-    print(f"  Average: {avg_total:.2f}s total, {avg_refresh:.2f}s refresh")
+    timings['multi'] = _report(total_times, refresh_times, " (3 regions)")
 
     # Test 5: Fast refresh benchmark
     print("\nFast refresh benchmark (4 iterations)...")
+    # 8 stripes of 18px with 19px gaps = 8*37 = 296px exactly, built once
+    # per colour: white stripes on black, then black stripes on white
+    fb.clear(black=True)
+    stripes = (_stripe_pattern(fb, 37, 18, black=False),)
+    fb.clear()
+    stripes += (_stripe_pattern(fb, 37, 18, black=True),)
     total_times = []
     refresh_times = []
     for i in range(4):
-        fb.clear(black=(i % 2 == 0))
-        # 8 stripes of 18px with 19px gaps = 8*37 = 296px exactly
-        for x in range(0, fb.width, 37):
-            shapes.fill_rect(fb, x, 0, 18, fb.height, black=(i % 2 == 1))
+        fb.buffer[:] = stripes[i % 2]
         start = time.monotonic()
         refresh_t = epd.display_full(fb.buffer, fast=True)
         total_t = time.monotonic() - start
         total_times.append(total_t)
         refresh_times.append(refresh_t)
-        print(f"  Run {i + 1}: {total_t:.2f}s total, {refresh_t:.2f}s refresh")
 
-    avg_total = sum(total_times) / len(total_times)
-    avg_refresh = sum(refresh_times) / len(refresh_times)
-    timings['fast'] = (avg_total, avg_refresh)
-    print(f"  Average: {avg_total:.2f}s total, {avg_refresh:.2f}s refresh")
+    timings['fast'] = _report(total_times, refresh_times)
 
     # Test 6: Power control test
     print("\nPower control test...")
@@ -187,35 +266,15 @@ def run(canvas, btns=None):
 
     fb.clear()
     shapes.fill_rect(fb, 150, 40, 48, 48)
-    epd.display_partial(fb.buffer)  # Should auto-wake and do full refresh (first after hibernate)
+    # Auto-wakes; stays a partial refresh since the diff buffer restores RAM
+    epd.display_partial(fb.buffer)
     print(f"    After partial (woke from hibernate): hibernating={epd.is_hibernating()}, init_done={epd.is_init_done()}")
 
     timings['power_off'] = power_off_time
     timings['power_on'] = power_on_time
 
     # Summary screen
-    canvas.clear()
-    canvas.text("REFRESH BENCHMARKS", canvas.width // 2, 2, align="center")
-    canvas.hline(10, 16, canvas.width - 20)
-
-    canvas.text("Mode", 10, 20)
-    canvas.text("Total", 150, 20)
-    canvas.text("Busy", 220, 20)
-
-    y = 36
-    for label, key in [("Full:", 'full'),
-                       ("Partial:", 'partial'),
-                       ("Region:", 'region'),
-                       ("Multi (3x):", 'multi'),
-                       ("Fast:", 'fast')]:
-        total_t, refresh_t = timings[key]
-        canvas.text(label, 10, y)
-        canvas.text(f"{total_t:.2f}s", 150, y)
-        canvas.text(f"{refresh_t:.2f}s", 220, y)
-        y += 16
-
-    canvas.hline(10, y + 2, canvas.width - 20)
-    canvas.text("Press any button", canvas.width // 2, y + 8, align="center")
+    _draw_summary(canvas, timings)
     canvas.update("full")
 
     print("\n--- Benchmark Results ---")
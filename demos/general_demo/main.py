@@ -16,13 +16,14 @@ from epd_driver import EPD
 from canvas import Canvas
 from buttons import Buttons
 
-# Demo registry: (name, module_name, run_function_name)
-# Each demo should have a run(canvas, btns) or run(canvas) function
+# Demo registry: (name, module_name, run_function_name, takes_btns)
+# takes_btns: True for run(canvas, btns), False for run(canvas) - declared
+# here because CircuitPython has no inspect module to probe the signature
 # Use None for module_name to indicate a special action (like toggle)
 DEMOS = [
-    ("Invert: OFF", None, "toggle_invert"),  # Special toggle action
-    ("Driver Demo", "demo_driver", "run"),
-    ("Canvas Demo", "demo_canvas", "run"),
+    ("Invert: OFF", None, "toggle_invert", False),  # Special toggle action
+    ("Driver Demo", "demo_driver", "run", True),
+    ("Canvas Demo", "demo_canvas", "run", True),
 ]
 
 # Display constants (tuned for 13px cozette font)
@@ -30,6 +31,9 @@ MENU_START_Y = 32
 LINE_HEIGHT = 18
 VISIBLE_ITEMS = 4  # Max items visible at once
 
+# Buttons accepted by the menu loop (tuple: no per-iteration allocation)
+_NAV_BUTTONS = (Buttons.A, Buttons.B, Buttons.D)
+
 
 class Menu:
     """Scrollable menu with cursor."""
@@ -40,25 +44,51 @@ class Menu:
         self.items = items
         self.cursor = 0
         self.scroll_offset = 0
+        self._chrome = None  # (inverted, buffer snapshot) of the static layout
+        self._lines = {}  # Menu line text -> (bitmap, w, h), see _line_bitmap()
+
+    def _line_bitmap(self, text):
+        """Return the pre-rendered bitmap for a menu line, rendering it once.
+
+        Keyed by the full line text, so a renamed item (toggle_invert)
+        simply gets a new entry.
+        """
+        entry = self._lines.get(text)
+        if entry is None:
+            entry = self._lines[text] = self.canvas.text_to_bitmap(text)
+        return entry
+
+    def _draw_chrome(self):
+        """Clear and draw the static parts of the menu (title, rules, footer)."""
+        c = self.canvas
+        width = c.width
+        height = c.height
+        c.clear()
+        c.text("MagTag Demos", width // 2, 6, align="center")
+        c.hline(10, 22, width - 20)
+        c.hline(10, height - 18, width - 20)
+        c.text("[A]Up [B]Down [D]Select", width // 2, height - 14, align="center")
 
     def draw(self, verbose=False):
         """Draw the menu screen. If verbose=True, print timing breakdown."""
         if verbose:
             t0 = time.monotonic()
 
-        self.canvas.clear()
+        # Clear + static chrome: drawn once, then restored with a single
+        # buffer copy. Re-snapshot if the framebuffer was inverted since.
+        c = self.canvas
+        buf = c.buffer
+        inverted = c._fb.is_inverted
+        chrome = self._chrome
+        if chrome is None or chrome[0] != inverted:
+            self._draw_chrome()
+            self._chrome = (inverted, bytes(buf))
+        else:
+            buf[:] = chrome[1]
 
         if verbose:
             t1 = time.monotonic()
 
-        # Title
-        self.canvas.text("MagTag Demos", self.canvas.width // 2, 6, align="center")
-
-        if verbose:
-            t2 = time.monotonic()
-
-        self.canvas.hline(10, 22, self.canvas.width - 20)
-
         # Menu items
         visible_count = min(len(self.items), VISIBLE_ITEMS)
         for i in range(visible_count):
@@ -71,34 +101,29 @@ class Menu:
 
             # Cursor indicator
             if item_idx == self.cursor:
-                self.canvas.text(f"> {name}", 15, y)
+                bmp, w, h = self._line_bitmap(f"> {name}")
             else:
-                self.canvas.text(f"  {name}", 15, y)
+                bmp, w, h = self._line_bitmap(f"  {name}")
+            c.blit(bmp, 15, y, w, h)
 
         # Scroll indicators
         if self.scroll_offset > 0:
-            self.canvas.text("^", self.canvas.width - 15, MENU_START_Y - 5)
+            c.text("^", c.width - 15, MENU_START_Y - 5)
         if self.scroll_offset + VISIBLE_ITEMS < len(self.items):
-            self.canvas.text("v", self.canvas.width - 15,
-                           MENU_START_Y + (visible_count - 1) * LINE_HEIGHT + 5)
-
-        # Footer with controls
-        self.canvas.hline(10, self.canvas.height - 18, self.canvas.width - 20)
-        self.canvas.text("[A]Up [B]Down [D]Select",
-                        self.canvas.width // 2, self.canvas.height - 14, align="center")
+            c.text("v", c.width - 15,
+                   MENU_START_Y + (visible_count - 1) * LINE_HEIGHT + 5)
 
         if verbose:
-            t3 = time.monotonic()
+            t2 = time.monotonic()
 
-        self.canvas.update("partial")
+        c.update("partial")
 
         if verbose:
-            t4 = time.monotonic()
+            t3 = time.monotonic()
             print(f"\n  [Menu draw breakdown]")
-            print(f"    FB clear:       {(t1 - t0)*1000:6.0f}ms")
-            print(f"    First text:     {(t2 - t1)*1000:6.0f}ms  (font load)")
-            print(f"    Rest of draw:   {(t3 - t2)*1000:6.0f}ms")
-            print(f"    EPD refresh:    {(t4 - t3)*1000:6.0f}ms")
+            print(f"    Clear+chrome:   {(t1 - t0)*1000:6.0f}ms")
+            print(f"    Items:          {(t2 - t1)*1000:6.0f}ms")
+            print(f"    EPD refresh:    {(t3 - t2)*1000:6.0f}ms")
 
     def move_up(self):
         """Move cursor up."""
@@ -123,7 +148,7 @@ class Menu:
     def wait_for_selection(self):
         """Wait for user input. Returns selected item on D, or None for navigation."""
         while True:
-            btn = self.btns.wait([Buttons.A, Buttons.B, Buttons.D])
+            btn = self.btns.wait(_NAV_BUTTONS)
 
             if btn == Buttons.A:  # Up
                 self.move_up()
@@ -135,7 +160,7 @@ class Menu:
                 return self.get_selected()
 
 
-def run_demo(name, module_name, func_name, canvas, btns):
+def run_demo(name, module_name, func_name, takes_btns, canvas, btns):
     """Import and run a demo."""
     print(f"\n{'=' * 40}")
     print(f"Running: {name}")
@@ -145,10 +170,11 @@ def run_demo(name, module_name, func_name, canvas, btns):
         module = __import__(module_name)
         run_func = getattr(module, func_name)
 
-        # Try with btns first, fall back to canvas only
-        try:
+        # Dispatch on the registered arity (a TypeError raised inside the
+        # demo is reported as an error, not retried with fewer args)
+        if takes_btns:
             run_func(canvas, btns)
-        except TypeError:
+        else:
             run_func(canvas)
 
     except Exception as e:
@@ -170,7 +196,7 @@ def toggle_invert(canvas, menu):
     # Update the menu item text
     for i, item in enumerate(menu.items):
         if item[2] == "toggle_invert":
-            menu.items[i] = (f"Invert: {state}", None, "toggle_invert")
+            menu.items[i] = (f"Invert: {state}", None, "toggle_invert", False)
             break
 
 
@@ -212,7 +238,7 @@ def main():
 
     # Main loop
     while True:
-        name, module_name, func_name = menu.wait_for_selection()
+        name, module_name, func_name, takes_btns = menu.wait_for_selection()
 
         if module_name is None:
             # Special action (not a demo)
@@ -221,7 +247,7 @@ def main():
                 menu.draw()  # Redraw after toggle
         else:
             # Run selected demo
-            run_demo(name, module_name, func_name, canvas, btns)
+            run_demo(name, module_name, func_name, takes_btns, canvas, btns)
             print("\nReturning to menu...")
             epd.init(clear=False)  # Re-init EPD in case demo put it to sleep
             menu.draw()  # Redraw menu after returning from demo
@@ -34,6 +34,9 @@ BF2 Format:
 Requirements:
     pip install bdflib fonttools Pillow
 
+    Optional (vectorized BDF loading, much faster for large fonts):
+    pip install numpy
+
 Usage:
     # From BDF to BF2 (most common)
     python font2bf2.py input.bdf output.bf2
@@ -63,6 +66,14 @@ import sys
 from pathlib import Path
 from typing import Set, Dict, List, Tuple, Optional
 from math import ceil
+from itertools import accumulate
+from collections import Counter
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # =============================================================================
 # Character Sets
@@ -123,23 +134,24 @@ def get_default_charset() -> Set[str]:
 # =============================================================================
 
 def extract_chars_from_json(json_path: Path) -> Set[str]:
-    """Extract all unique characters from a JSON file."""
-    chars = set()
+    """Extract all unique characters from a JSON file's string values."""
     with open(json_path, 'r', encoding='utf-8') as f:
         data = json.load(f)
 
-    def extract_from_value(value):
+    # Iterative walk (no recursion limit on deeply nested decks); strings are
+    # collected and added to the set in one bulk update at the end.
+    strings = []
+    stack = [data]
+    while stack:
+        value = stack.pop()
         if isinstance(value, str):
-            chars.update(value)
+            strings.append(value)
         elif isinstance(value, list):
-            for item in value:
-                extract_from_value(item)
+            stack.extend(value)
         elif isinstance(value, dict):
-            for v in value.values():
-                extract_from_value(v)
+            stack.extend(value.values())
 
-    extract_from_value(data)
-    return chars
+    return set(''.join(strings))
 
 
 def extract_chars_from_text(text_path: Path) -> Set[str]:
@@ -193,6 +205,41 @@ def load_charset_file(charset_path: Path) -> Set[str]:
 # BDF Parser (using bdflib)
 # =============================================================================
 
+def _glyph_cell_numpy(src_rows: List[int], bb_w: int, bb_x: int, glyph_top: int,
+                      font_height: int, bytes_per_row: int) -> bytes:
+    """
+    Place a glyph bitmap into its font cell using NumPy (one pass per glyph).
+
+    Args:
+        src_rows: Glyph rows top-to-bottom, each an int of bb_w bits (MSB = left)
+        bb_w: Glyph bounding box width
+        bb_x: Horizontal offset of the bounding box within the cell
+        glyph_top: Cell row of the first glyph row (may be negative)
+        font_height: Cell height in rows
+        bytes_per_row: Cell row stride in bytes
+
+    Returns:
+        Packed cell bitmap (font_height * bytes_per_row bytes)
+    """
+    cell_w = bytes_per_row * 8
+    cell = np.zeros((font_height, cell_w), dtype=np.uint8)
+
+    g_h = len(src_rows)
+    y0, y1 = max(glyph_top, 0), min(glyph_top + g_h, font_height)
+    x0, x1 = max(bb_x, 0), min(bb_x + bb_w, cell_w)
+
+    if bb_w > 0 and y0 < y1 and x0 < x1:
+        src_bytes = (bb_w + 7) // 8
+        raw = b''.join(r.to_bytes(src_bytes, 'big') for r in src_rows)
+        bits = np.unpackbits(
+            np.frombuffer(raw, dtype=np.uint8).reshape(g_h, src_bytes), axis=1
+        )[:, src_bytes * 8 - bb_w:]
+        cell[y0:y1, x0:x1] = bits[y0 - glyph_top:y1 - glyph_top,
+                                  x0 - bb_x:x1 - bb_x]
+
+    return np.packbits(cell, axis=1).tobytes()
+
+
 def load_bdf_font(bdf_path: Path, allow_32bit: bool = False) -> Tuple[Dict, dict]:
     """
     Load a BDF font and return glyphs and properties.
@@ -227,45 +274,60 @@ def load_bdf_font(bdf_path: Path, allow_32bit: bool = False) -> Tuple[Dict, dict
     glyphs = {}
     max_codepoint = 0xFFFFFFFF if allow_32bit else 0xFFFF
 
+    # Per-font invariants, hoisted out of the glyph and row loops
+    bytes_per_row = ceil(max_width / 8)
+    row_bits = bytes_per_row * 8
+    row_mask = (1 << row_bits) - 1
+    baseline_row = font_ascent - 1
+    byte_shifts = tuple(range(row_bits - 8, -1, -8))  # MSB byte first
+
     for glyph in font.glyphs:
-        if glyph.codepoint is None or glyph.codepoint > max_codepoint:
+        codepoint = glyph.codepoint
+        if codepoint is None or codepoint > max_codepoint:
             continue
 
         # BDF data is stored bottom-to-top, reverse it
         glyph_data = list(reversed(glyph.data))
-        g_h = glyph.bbH
-        g_y = glyph.bbY  # offset from baseline
+        bb_w = glyph.bbW
+        bb_x = glyph.bbX
 
-        # Position glyph in output grid
-        baseline_row = font_ascent - 1
-        glyph_bottom = baseline_row - g_y
-        glyph_top = glyph_bottom - g_h + 1
+        # Position glyph in output grid (bbY is the offset from baseline)
+        glyph_bottom = baseline_row - glyph.bbY
+        glyph_top = glyph_bottom - glyph.bbH + 1
 
         # Build row-major bitmap
-        bytes_per_row = ceil(max_width / 8)
-        rows = []
-
-        for y in range(font_height):
-            row_byte = 0
-            src_row = y - glyph_top
-
-            if 0 <= src_row < len(glyph_data):
-                # Get source row bits, shift to align with MSB
-                src_bits = glyph_data[src_row]
-                # BDF stores bits left-aligned in the bounding box
-                # Shift to fit in max_width
-                shift = (bytes_per_row * 8) - glyph.bbW
-                row_byte = src_bits << (shift - glyph.bbX) if shift > glyph.bbX else src_bits >> (glyph.bbX - shift)
-                row_byte &= (1 << (bytes_per_row * 8)) - 1
-
-            # Convert to bytes
-            row_bytes = row_byte.to_bytes(bytes_per_row, 'big')
-            rows.append(row_bytes)
-
-        glyphs[glyph.codepoint] = {
+        if np is not None:
+            glyphs[codepoint] = {
+                'width': glyph.advance,
+                'bbw': bb_w + bb_x,  # actual pixel extent
+                'data': _glyph_cell_numpy(glyph_data, bb_w, bb_x,
+                                          glyph_top, font_height, bytes_per_row),
+            }
+            continue
+
+        # BDF stores bits left-aligned in the bounding box; shift to fit in
+        # max_width, offset by bbX (left or right depending on sign)
+        shift = row_bits - bb_w
+        lshift = shift - bb_x if shift > bb_x else 0
+        rshift = bb_x - shift if shift <= bb_x else 0
+
+        # Write bytes straight into a zeroed cell; rows outside the glyph's
+        # bounding box stay blank without being touched
+        out = bytearray(font_height * bytes_per_row)
+        y0 = max(glyph_top, 0)
+        y1 = min(glyph_top + len(glyph_data), font_height)
+        for y in range(y0, y1):
+            row_int = ((glyph_data[y - glyph_top] << lshift) >> rshift) & row_mask
+            if row_int:
+                o = y * bytes_per_row
+                for s in byte_shifts:
+                    out[o] = (row_int >> s) & 0xFF
+                    o += 1
+
+        glyphs[codepoint] = {
             'width': glyph.advance,
-            'bbw': glyph.bbW + glyph.bbX,  # actual pixel extent
-            'data': b''.join(rows),
+            'bbw': bb_w + bb_x,  # actual pixel extent
+            'data': bytes(out),
         }
 
     properties = {
@@ -294,6 +356,7 @@ def create_arrow_glyphs(height: int, width: int) -> Dict:
         Dict with codepoints 0x25B2 (▲) and 0x25BC (▼)
     """
     bytes_per_row = ceil(width / 8)
+    total_bits = bytes_per_row * 8
     glyphs = {}
 
     # Calculate arrow dimensions based on font size
@@ -316,12 +379,8 @@ def create_arrow_glyphs(height: int, width: int) -> Dict:
             # Center the pixels
             start_pixel = (width - pixels_in_row) // 2
 
-            # Build row bitmap
-            row_bits = 0
-            for px in range(pixels_in_row):
-                bit_pos = (bytes_per_row * 8 - 1) - (start_pixel + px)
-                if bit_pos >= 0:
-                    row_bits |= (1 << bit_pos)
+            # Build row bitmap: one contiguous run of set bits (MSB = left)
+            row_bits = ((1 << pixels_in_row) - 1) << max(0, total_bits - start_pixel - pixels_in_row)
 
             rows_up.append(row_bits.to_bytes(bytes_per_row, 'big'))
         else:
@@ -409,6 +468,39 @@ BF2_INDEX_ENTRY_SIZE = 6
 FLAG_PROPORTIONAL = 0x01
 FLAG_32BIT_CODEPOINTS = 0x02
 
+# Header: magic, version, flags, max_width, height, glyph_count,
+# bytes_per_row, default_width, reserved
+_BF2_HEADER = struct.Struct('<2sBBBBHBBH')
+
+# Index entry: codepoint (2 or 4), width (1), offset (3, little-endian)
+_IDX16_FMT = 'HBBBB'
+_IDX32_FMT = 'IBBBB'
+
+
+def _index_table_numpy(codepoints: List[int], widths: List[int], offsets: List[int],
+                       use_32bit: bool) -> bytes:
+    """
+    Build the whole BF2 index table as one NumPy structured array.
+
+    Args:
+        codepoints: Sorted codepoints
+        widths: Per-glyph widths (0 = monospace)
+        offsets: Glyph data offset of each codepoint
+        use_32bit: Use 32-bit codepoints
+
+    Returns:
+        Packed index table (6 or 8 bytes per entry)
+    """
+    entry = np.dtype([('cp', '<u4' if use_32bit else '<u2'), ('w', 'u1'),
+                      ('off', 'u1', (3,))])
+    table = np.empty(len(codepoints), dtype=entry)
+    table['cp'] = codepoints
+    table['w'] = widths
+    # 3-byte offset: low three bytes of each little-endian uint32
+    off = np.asarray(offsets, dtype='<u4')
+    table['off'] = off.view(np.uint8).reshape(-1, 4)[:, :3]
+    return table.tobytes()
+
 
 def write_bf2(output_path: Path, glyphs: Dict, properties: dict,
               charset: Set[str] = None, proportional: bool = True,
@@ -430,7 +522,7 @@ def write_bf2(output_path: Path, glyphs: Dict, properties: dict,
 
     # Filter glyphs by charset
     if charset:
-        codepoints = sorted(ord(c) for c in charset if ord(c) in glyphs)
+        codepoints = sorted(glyphs.keys() & set(map(ord, charset)))
     else:
         codepoints = sorted(glyphs.keys())
 
@@ -438,42 +530,53 @@ def write_bf2(output_path: Path, glyphs: Dict, properties: dict,
         print("Error: No glyphs to write!")
         return
 
-    # Determine default width (most common or average)
-    widths = [glyphs[cp]['width'] for cp in codepoints]
-    default_width = max(set(widths), key=widths.count)
-
-    # Check if actually proportional
-    is_proportional = proportional and len(set(widths)) > 1
+    # Look each glyph up once; widths and data are pulled from this list
+    glyph_list = list(map(glyphs.__getitem__, codepoints))
+
+    # Determine default width (most common) and whether widths actually vary.
+    # Monospace output advances every glyph by max_width, so missing glyphs
+    # fall back to the same and no width scan is needed.
+    if proportional:
+        widths = list(map(itemgetter('width'), glyph_list))
+        width_counts = Counter(widths)
+        default_width = width_counts.most_common(1)[0][0]
+        is_proportional = len(width_counts) > 1
+    else:
+        default_width = max_width
+        is_proportional = False
 
     print(f"Writing BF2: {len(codepoints)} glyphs, {max_width}x{height}, " +
           f"{'proportional' if is_proportional else 'monospace'}")
 
-    # Build glyph data and index
-    glyph_data = bytearray()
-    index_entries = []
+    # Separate passes over plain lists: glyph data and offsets, then the
+    # index table, then one join for the data blob
+    parts = list(map(itemgetter('data'), glyph_list))
+    offsets = list(accumulate(map(len, parts), initial=0))[:-1]
+    entry_widths = widths if is_proportional else [0] * len(codepoints)
 
-    for cp in codepoints:
-        glyph = glyphs[cp]
-        width = glyph['width'] if is_proportional else 0
-        offset = len(glyph_data)
+    if np is not None:
+        index_data = _index_table_numpy(codepoints, entry_widths, offsets, use_32bit)
+    else:
+        # Mode choices (entry format, stored widths) are settled above, so the
+        # flat field list is one branch-free comprehension
+        entry_fmt = _IDX32_FMT if use_32bit else _IDX16_FMT
+        index_fields = [
+            field
+            for cp, width, offset in zip(codepoints, entry_widths, offsets)
+            for field in (cp, width, offset & 0xFF,
+                          (offset >> 8) & 0xFF, (offset >> 16) & 0xFF)
+        ]
 
-        # Index entry: codepoint (2 or 4), width (1), offset (3)
-        if use_32bit:
-            index_entries.append(struct.pack('<IB', cp, width) +
-                               offset.to_bytes(3, 'little'))
-        else:
-            index_entries.append(struct.pack('<HB', cp, width) +
-                               offset.to_bytes(3, 'little'))
+        # Whole index table in one pack call
+        index_data = struct.pack('<' + entry_fmt * len(codepoints), *index_fields)
 
-        # Glyph data
-        glyph_data.extend(glyph['data'])
+    glyph_data = b''.join(parts)
 
     # Build header
     flags = FLAG_PROPORTIONAL if is_proportional else 0
     if use_32bit:
         flags |= FLAG_32BIT_CODEPOINTS
-    header = struct.pack(
-        '<2sBBBBHBBH',
+    header = _BF2_HEADER.pack(
         BF2_MAGIC,
         BF2_VERSION,
         flags,
@@ -485,12 +588,9 @@ def write_bf2(output_path: Path, glyphs: Dict, properties: dict,
         0  # reserved
     )
 
-    # Write file
+    # Write file (single write)
     with open(output_path, 'wb') as f:
-        f.write(header)
-        for entry in index_entries:
-            f.write(entry)
-        f.write(glyph_data)
+        f.write(b''.join((header, index_data, glyph_data)))
 
     size_kb = output_path.stat().st_size / 1024
     print(f"Created: {output_path} ({size_kb:.1f} KB)")
@@ -500,6 +600,14 @@ def write_bf2(output_path: Path, glyphs: Dict, properties: dict,
 # BDF Writer
 # =============================================================================
 
+_BDF_GLYPHS_PER_WRITE = 256   # Glyphs of text joined per f.write()
+_BDF_WRITE_BUFFER = 1 << 20    # Output file buffer size (bytes)
+
+# STARTCHAR names for ASCII codepoints (never contain spaces)
+_BDF_ASCII_NAMES = tuple(chr(c) if chr(c).isalnum() else f"U+{c:04X}"
+                         for c in range(128))
+
+
 def write_bdf(output_path: Path, glyphs: Dict, properties: dict,
               charset: Set[str] = None, font_name: str = None):
     """
@@ -520,7 +628,7 @@ def write_bdf(output_path: Path, glyphs: Dict, properties: dict,
 
     # Filter glyphs by charset
     if charset:
-        codepoints = sorted(ord(c) for c in charset if ord(c) in glyphs)
+        codepoints = sorted(glyphs.keys() & set(map(ord, charset)))
     else:
         codepoints = sorted(glyphs.keys())
 
@@ -534,58 +642,61 @@ def write_bdf(output_path: Path, glyphs: Dict, properties: dict,
 
     print(f"Writing BDF: {len(codepoints)} glyphs, {max_width}x{height}")
 
-    with open(output_path, 'w', encoding='utf-8') as f:
+    row_chars = bytes_per_row * 2  # Hex digits per bitmap row
+    bitmap_chars = row_chars * height
+
+    with open(output_path, 'w', encoding='utf-8', buffering=_BDF_WRITE_BUFFER) as f:
+        # Output text is collected and written in batches of glyphs: few write
+        # calls, without holding a whole CJK-sized BDF in memory
+        out = []
+
         # BDF Header
-        f.write("STARTFONT 2.1\n")
-        f.write(f"FONT -{font_name}-medium-r-normal--{height}-{height*10}-75-75-c-{max_width*10}-iso10646-1\n")
-        f.write(f"SIZE {height} 75 75\n")
-        f.write(f"FONTBOUNDINGBOX {max_width} {height} 0 {-descent}\n")
+        out.append("STARTFONT 2.1\n")
+        out.append(f"FONT -{font_name}-medium-r-normal--{height}-{height*10}-75-75-c-{max_width*10}-iso10646-1\n")
+        out.append(f"SIZE {height} 75 75\n")
+        out.append(f"FONTBOUNDINGBOX {max_width} {height} 0 {-descent}\n")
 
         # Properties
-        f.write("STARTPROPERTIES 6\n")
-        f.write(f"FONT_ASCENT {ascent}\n")
-        f.write(f"FONT_DESCENT {descent}\n")
-        f.write(f"PIXEL_SIZE {height}\n")
-        f.write(f"POINT_SIZE {height * 10}\n")
-        f.write("SPACING \"C\"\n")
-        f.write(f"DEFAULT_CHAR {codepoints[0] if codepoints else 32}\n")
-        f.write("ENDPROPERTIES\n")
-
-        f.write(f"CHARS {len(codepoints)}\n")
-
-        # Write each glyph
-        for cp in codepoints:
+        out.append("STARTPROPERTIES 6\n")
+        out.append(f"FONT_ASCENT {ascent}\n")
+        out.append(f"FONT_DESCENT {descent}\n")
+        out.append(f"PIXEL_SIZE {height}\n")
+        out.append(f"POINT_SIZE {height * 10}\n")
+        out.append("SPACING \"C\"\n")
+        out.append(f"DEFAULT_CHAR {codepoints[0] if codepoints else 32}\n")
+        out.append("ENDPROPERTIES\n")
+
+        out.append(f"CHARS {len(codepoints)}\n")
+
+        # Each glyph
+        for i, cp in enumerate(codepoints, 1):
             glyph = glyphs[cp]
             width = glyph['width']
             data = glyph['data']
 
-            # Glyph name (use Unicode name or hex)
-            if cp < 128 and chr(cp).isprintable():
-                name = chr(cp) if chr(cp).isalnum() else f"U+{cp:04X}"
-            else:
-                name = f"U+{cp:04X}"
-            # Escape special chars in name
-            name = name.replace(' ', '_')
-
-            f.write(f"STARTCHAR {name}\n")
-            f.write(f"ENCODING {cp}\n")
-            f.write(f"SWIDTH {width * 1000 // height} 0\n")
-            f.write(f"DWIDTH {width} 0\n")
-            f.write(f"BBX {width} {height} 0 {-descent}\n")
-            f.write("BITMAP\n")
-
-            # Write bitmap rows
-            for row in range(height):
-                row_start = row * bytes_per_row
-                row_bytes = data[row_start:row_start + bytes_per_row]
+            # Glyph name (ASCII alphanumerics as-is, otherwise hex)
+            name = _BDF_ASCII_NAMES[cp] if cp < 128 else f"U+{cp:04X}"
+
+            out.append(f"STARTCHAR {name}\n")
+            out.append(f"ENCODING {cp}\n")
+            out.append(f"SWIDTH {width * 1000 // height} 0\n")
+            out.append(f"DWIDTH {width} 0\n")
+            out.append(f"BBX {width} {height} 0 {-descent}\n")
+            out.append("BITMAP\n")
 
-                # Convert to hex string
-                hex_str = ''.join(f'{b:02X}' for b in row_bytes)
-                f.write(f"{hex_str}\n")
+            # Bitmap rows, sliced from one hex string of the whole glyph and
+            # appended as a single block
+            hex_all = data.hex().upper()
+            out.append('\n'.join([hex_all[i:i + row_chars]
+                                   for i in range(0, bitmap_chars, row_chars)]))
+            out.append("\nENDCHAR\n")
 
-            f.write("ENDCHAR\n")
+            if i % _BDF_GLYPHS_PER_WRITE == 0:
+                f.write(''.join(out))
+                out.clear()
 
-        f.write("ENDFONT\n")
+        out.append("ENDFONT\n")
+        f.write(''.join(out))
 
     size_kb = output_path.stat().st_size / 1024
     print(f"Created: {output_path} ({size_kb:.1f} KB)")
@@ -595,6 +706,24 @@ def write_bdf(output_path: Path, glyphs: Dict, properties: dict,
 # Preview
 # =============================================================================
 
+# Preview rendering: each byte value as 8 bit digits (MSB first), mapped
+# to pixel characters with one translate per row
+_BYTE_TO_BITS = [format(b, '08b') for b in range(256)]
+_BITS_TO_PIXELS = str.maketrans('01', '·█')
+
+
+def _ink_width_numpy(data: bytes, height: int, bytes_per_row: int,
+                     max_width: int) -> int:
+    """Return one past the rightmost set pixel column of a glyph cell (NumPy)."""
+    size = height * bytes_per_row
+    cell = np.zeros(size, dtype=np.uint8)
+    raw = np.frombuffer(data[:size], dtype=np.uint8)
+    cell[:len(raw)] = raw
+    bits = np.unpackbits(cell.reshape(height, bytes_per_row), axis=1)[:, :max_width]
+    used = np.flatnonzero(bits.any(axis=0))
+    return int(used[-1]) + 1 if used.size else 0
+
+
 def preview_glyphs(glyphs: Dict, properties: dict, text: str):
     """Print ASCII art preview of glyphs."""
     height = properties['height']
@@ -615,16 +744,19 @@ def preview_glyphs(glyphs: Dict, properties: dict, text: str):
         data = glyph['data']
 
         # Find actual used width (rightmost set pixel)
-        actual_width = 0
-        for row in range(height):
-            row_start = row * bytes_per_row
-            row_bytes = data[row_start:row_start + bytes_per_row]
-            for col in range(max_width - 1, -1, -1):
-                byte_idx = col // 8
-                bit_idx = 7 - (col % 8)
-                if byte_idx < len(row_bytes) and (row_bytes[byte_idx] >> bit_idx) & 1:
-                    actual_width = max(actual_width, col + 1)
-                    break
+        if np is not None:
+            actual_width = _ink_width_numpy(data, height, bytes_per_row, max_width)
+        else:
+            actual_width = 0
+            for row in range(height):
+                row_start = row * bytes_per_row
+                row_bytes = data[row_start:row_start + bytes_per_row]
+                for col in range(max_width - 1, -1, -1):
+                    byte_idx = col // 8
+                    bit_idx = 7 - (col % 8)
+                    if byte_idx < len(row_bytes) and (row_bytes[byte_idx] >> bit_idx) & 1:
+                        actual_width = max(actual_width, col + 1)
+                        break
 
         # Display width is max of advance and actual pixels
         display_width = max(width, actual_width)
@@ -635,15 +767,9 @@ def preview_glyphs(glyphs: Dict, properties: dict, text: str):
             row_start = row * bytes_per_row
             row_bytes = data[row_start:row_start + bytes_per_row]
 
-            line = ""
-            for col in range(display_width):
-                byte_idx = col // 8
-                bit_idx = 7 - (col % 8)
-                if byte_idx < len(row_bytes) and (row_bytes[byte_idx] >> bit_idx) & 1:
-                    line += "█"
-                else:
-                    line += "·"
-            print(f"  {line}")
+            bits = ''.join([_BYTE_TO_BITS[b] for b in row_bytes])
+            line = bits[:display_width].ljust(display_width, '0')
+            print(f"  {line.translate(_BITS_TO_PIXELS)}")
         print()
 
 
@@ -6,11 +6,12 @@ Modules:
     draw: Shape drawing primitives (lines, rectangles, circles, etc.)
 """
 from .framebuffer import FrameBuffer, BLACK, WHITE, DARK_GRAY, LIGHT_GRAY
-from .draw import DrawBuffer
+from .draw import DrawBuffer, Sprite2
 
 __all__ = [
     "FrameBuffer",
     "DrawBuffer",
+    "Sprite2",
     "BLACK",
     "WHITE",
     "DARK_GRAY",
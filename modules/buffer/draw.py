@@ -4,8 +4,131 @@ DrawBuffer - Shape Drawing Primitives
 Extends FrameBuffer with geometric shapes and bitmaps.
 """
 
-from .framebuffer import FrameBuffer, BLACK, WHITE, DARK_GRAY, LIGHT_GRAY, _BIT_MASKS, _INV_MASKS
-__all__ = ["DrawBuffer", "BLACK", "WHITE", "DARK_GRAY", "LIGHT_GRAY"]
+from .framebuffer import (FrameBuffer, BLACK, WHITE, DARK_GRAY, LIGHT_GRAY, _BIT_MASKS, _INV_MASKS,
+                          _TWO_BIT_MASK, _TWO_BIT_FILL, _TWO_BIT_SHIFT_BASE, _TWO_BIT_SHIFTS,
+                          _TWO_BIT_KEEP)
+__all__ = ["DrawBuffer", "Sprite2", "BLACK", "WHITE", "DARK_GRAY", "LIGHT_GRAY"]
+
+
+# Column (0 = MSB) of a single-bit byte value, indexed by the value itself
+_LSB_COL = bytes(sum(k for k in range(8) if v == 0x80 >> k) for v in range(129))
+
+# =============================================================================
+# Line Clipping
+# =============================================================================
+
+# Cohen-Sutherland outcode bits
+_LEFT = 1
+_RIGHT = 2
+_BOTTOM = 4
+_TOP = 8
+
+
+def _clip_line(x0, y0, x1, y1, xmax, ymax):
+    """Cohen-Sutherland clip against (0, 0)-(xmax, ymax).
+
+    Returns the clipped (x0, y0, x1, y1), or None if the line lies outside.
+    All arithmetic is integer floor division, so no casts are needed.
+    """
+    # Outcodes are built branch-free from the four comparisons
+    code0 = (x0 < 0) | ((x0 > xmax) << 1) | ((y0 < 0) << 2) | ((y0 > ymax) << 3)
+    code1 = (x1 < 0) | ((x1 > xmax) << 1) | ((y1 < 0) << 2) | ((y1 > ymax) << 3)
+
+    while code0 | code1:
+        if code0 & code1:  # Both outside same zone
+            return None
+
+        # Pick outside point
+        outcode = code0 if code0 else code1
+        if outcode & _TOP:
+            x = x0 + (x1 - x0) * (ymax - y0) // (y1 - y0)
+            y = ymax
+        elif outcode & _BOTTOM:
+            x = x0 + (x1 - x0) * -y0 // (y1 - y0)
+            y = 0
+        elif outcode & _RIGHT:
+            y = y0 + (y1 - y0) * (xmax - x0) // (x1 - x0)
+            x = xmax
+        else:
+            y = y0 + (y1 - y0) * -x0 // (x1 - x0)
+            x = 0
+
+        if outcode == code0:
+            x0, y0 = x, y
+            code0 = (x < 0) | ((x > xmax) << 1) | ((y < 0) << 2) | ((y > ymax) << 3)
+        else:
+            x1, y1 = x, y
+            code1 = (x < 0) | ((x > xmax) << 1) | ((y < 0) << 2) | ((y > ymax) << 3)
+
+    return x0, y0, x1, y1
+
+
+# =============================================================================
+# Line Loops (physical coordinates, rotation already resolved)
+# =============================================================================
+
+def _line_1bit(buf, stride, px, py, mx, my, nx, ny, dx, dy, color):
+    """Bresenham run of dx + 1 pixels from (px, py) on a 1-bit buffer.
+
+    (mx, my) is the physical step per pixel, (nx, ny) the extra step taken
+    when the error term wraps.
+    """
+    err = dx // 2
+    bit_masks = _BIT_MASKS
+    inv_masks = _INV_MASKS
+    for _ in range(dx + 1):
+        idx = py * stride + (px >> 3)
+        if color: buf[idx] |= bit_masks[px & 7]
+        else: buf[idx] &= inv_masks[px & 7]
+        px += mx
+        py += my
+        err -= dy
+        if err < 0:
+            px += nx
+            py += ny
+            err += dx
+
+
+def _line_2bit(buf, phys_w, px, py, mx, my, nx, ny, dx, dy, color):
+    """Bresenham run of dx + 1 pixels from (px, py) on a 2-bit buffer."""
+    err = dx // 2
+    value = color & _TWO_BIT_MASK
+    # Pre-shifted value per pixel slot, so each pixel is two lookups
+    values = tuple(value << s for s in _TWO_BIT_SHIFTS)
+    keep = _TWO_BIT_KEEP
+    for _ in range(dx + 1):
+        off = py * phys_w + px
+        idx = off >> 2
+        buf[idx] = (buf[idx] & keep[off & 3]) | values[off & 3]
+        px += mx
+        py += my
+        err -= dy
+        if err < 0:
+            px += nx
+            py += ny
+            err += dx
+
+
+class Sprite2:
+    """
+    1-bit bitmap pre-expanded to a 2-bit mask plane for repeated blits.
+
+    Created by DrawBuffer.prepare_2bit_sprite. The mask is laid out in the
+    physical orientation of the buffer's rotation at that time, with 0b11
+    for each set source pixel, so blit() can merge whole rows as ints.
+    The source bitmap is kept for other rotations and 1-bit buffers.
+    """
+    __slots__ = ("bitmap", "w", "h", "rotation", "pw", "ph", "row_bytes", "mask")
+
+    def __init__(self, bitmap, w, h, rotation, pw, ph, row_bytes, mask):
+        self.bitmap = bitmap
+        self.w = w
+        self.h = h
+        self.rotation = rotation
+        self.pw = pw
+        self.ph = ph
+        self.row_bytes = row_bytes
+        self.mask = mask
 
 
 class DrawBuffer(FrameBuffer):
@@ -19,57 +142,10 @@ class DrawBuffer(FrameBuffer):
 
     def line(self, x0: int, y0: int, x1: int, y1: int, color: int = BLACK) -> None:
         """Draw a line using Bresenham's algorithm with clipping."""
-        # Cohen-Sutherland clipping constants
-        INSIDE = 0
-        LEFT = 1
-        RIGHT = 2
-        BOTTOM = 4
-        TOP = 8
-
-        xmin, xmax = 0, self.width - 1
-        ymin, ymax = 0, self.height - 1
-
-        def _compute_outcode(x, y):
-            code = INSIDE
-            if x < xmin: code |= LEFT
-            elif x > xmax: code |= RIGHT
-            if y < ymin: code |= BOTTOM
-            elif y > ymax: code |= TOP
-            return code
-
-        code0 = _compute_outcode(x0, y0)
-        code1 = _compute_outcode(x1, y1)
-
-        # Clipping loop
-        while True:
-            if not (code0 | code1):  # Both inside
-                break
-            elif code0 & code1:  # Both outside same zone
-                return
-            else:
-                # Pick outside point
-                outcode = code0 if code0 else code1
-                x, y = 0, 0
-
-                if outcode & TOP:
-                    x = x0 + (x1 - x0) * (ymax - y0) // (y1 - y0)
-                    y = ymax
-                elif outcode & BOTTOM:
-                    x = x0 + (x1 - x0) * (ymin - y0) // (y1 - y0)
-                    y = ymin
-                elif outcode & RIGHT:
-                    y = y0 + (y1 - y0) * (xmax - x0) // (x1 - x0)
-                    x = xmax
-                elif outcode & LEFT:
-                    y = y0 + (y1 - y0) * (xmin - x0) // (x1 - x0)
-                    x = xmin
-
-                if outcode == code0:
-                    x0, y0 = int(x), int(y)
-                    code0 = _compute_outcode(x0, y0)
-                else:
-                    x1, y1 = int(x), int(y)
-                    code1 = _compute_outcode(x1, y1)
+        clipped = _clip_line(x0, y0, x1, y1, self.width - 1, self.height - 1)
+        if clipped is None:
+            return
+        x0, y0, x1, y1 = clipped
 
         # Draw clipped line
         steep = abs(y1 - y0) > abs(x1 - x0)
@@ -82,56 +158,84 @@ class DrawBuffer(FrameBuffer):
 
         dx = x1 - x0
         dy = abs(y1 - y0)
-        err = dx // 2
         ystep = 1 if y0 < y1 else -1
 
-        # Retrieve fast pixel setter to avoid lookup in loop
-        # We need to handle rotation manually here if we want max speed,
-        # but using pixel_fast is a good middle ground after clipping.
-        # For maximum speed, we unroll the rotation check once:
-
-        is_swapped, x_flip, y_flip = self._rot_props
-        phys_w, phys_h = self._phys_w, self._phys_h
-        effective_col = self._effective_color(color)
-
-        # Pre-calculate transform factors
-        # Logical (lx, ly) -> Physical (px, py)
-        # If steep, (lx, ly) are actually (y, x) in loop variables
-
-        y = y0
-        for x in range(x0, x1 + 1):
-            # Resolve logical coordinates
-            lx, ly = (y, x) if steep else (x, y)
-
-            # Inline Transform
-            if is_swapped:
-                px, py = ly, lx
-            else:
-                px, py = lx, ly
+        # Resolve the rotation once through the affine map: start pixel plus
+        # the physical step for the major axis (+1) and minor axis (ystep),
+        # then run a loop that only does buffer arithmetic.
+        a, b, c, d, e, f = self._rot_affine
+        lx, ly = (y0, x0) if steep else (x0, y0)
+        px = a * lx + b * ly + c
+        py = d * lx + e * ly + f
+        if steep:
+            mx, my = b, e
+            nx, ny = a * ystep, d * ystep
+        else:
+            mx, my = a, d
+            nx, ny = b * ystep, e * ystep
+
+        effective_col = self._color_map[color & _TWO_BIT_MASK]
+        self._dirty = True
+        if self._depth == 1:
+            _line_1bit(self._buffer, self._row_bytes, px, py, mx, my, nx, ny,
+                       dx, dy, effective_col)
+        else:
+            _line_2bit(self._buffer, self._phys_w, px, py, mx, my, nx, ny,
+                       dx, dy, effective_col)
 
-            if x_flip: px = phys_w - 1 - px
-            if y_flip: py = phys_h - 1 - py
+    # =========================================================================
+    # Point Plotting
+    # =========================================================================
 
-            # Inline Pixel Set
-            if self._depth == 1:
-                self._set_pixel_1bit(px, py, effective_col)
+    def _plot_points(self, pts: list, color: int) -> None:
+        """Plot logical points given as a flat [x0, y0, x1, y1, ...] list.
+
+        Same result as pixel() per point, with the bounds check, affine
+        transform and bit write inlined.
+        """
+        width, height = self.width, self.height
+        a, b, c, d, e, f = self._rot_affine
+        eff = self._color_map[color & _TWO_BIT_MASK]
+        self._dirty = True
+
+        it = iter(pts)
+        if self._depth == 1:
+            # Color picked once: each point is a bounds check, the affine
+            # map and a single OR (white) or AND (black) into the buffer
+            buf = self._buffer
+            stride = self._row_bytes
+            if eff:
+                bit_masks = _BIT_MASKS
+                for x, y in zip(it, it):
+                    if 0 <= x < width and 0 <= y < height:
+                        px = a * x + b * y + c
+                        buf[(d * x + e * y + f) * stride + (px >> 3)] |= bit_masks[px & 7]
             else:
-                self._set_pixel_2bit(px, py, effective_col)
-
-            err -= dy
-            if err < 0:
-                y += ystep
-                err += dx
+                inv_masks = _INV_MASKS
+                for x, y in zip(it, it):
+                    if 0 <= x < width and 0 <= y < height:
+                        px = a * x + b * y + c
+                        buf[(d * x + e * y + f) * stride + (px >> 3)] &= inv_masks[px & 7]
+        else:
+            set_pixel = self._set_pixel_2bit
+            for x, y in zip(it, it):
+                if 0 <= x < width and 0 <= y < height:
+                    set_pixel(a * x + b * y + c, d * x + e * y + f, eff)
 
     # =========================================================================
     # Rectangle
     # =========================================================================
 
     def rect(self, x: int, y: int, w: int, h: int, color: int = BLACK) -> None:
+        if w <= 2 or h <= 2:
+            # No interior: the outline is the whole rectangle
+            self.fill_rect(x, y, w, h, color)
+            return
+        # Corners belong to the horizontal edges; the sides fill in between
         self.hline(x, y, w, color)
         self.hline(x, y + h - 1, w, color)
-        self.vline(x, y, h, color)
-        self.vline(x + w - 1, y, h, color)
+        self.vline(x, y + 1, h - 2, color)
+        self.vline(x + w - 1, y + 1, h - 2, color)
 
     def fill_rect(self, x: int, y: int, w: int, h: int, color: int = BLACK) -> None:
         # Clip to bounds
@@ -149,9 +253,13 @@ class DrawBuffer(FrameBuffer):
         if w <= 0 or h <= 0:
             return
 
-        # Use optimized hline (which handles byte-aligned writes)
-        for row in range(h):
-            self.hline(x, y + row, w, color)
+        # Fill physical rows: whatever the rotation, every row is a
+        # horizontal run whose whole bytes are slice-filled
+        px, py, pw, ph = self.transform_region(x, y, w, h)
+        effective = self._color_map[color & _TWO_BIT_MASK]
+        hline_phys = self._hline_phys
+        for row in range(py, py + ph):
+            hline_phys(px, row, pw, effective)
 
     # =========================================================================
     # Circle (Bresenham Optimized)
@@ -165,10 +273,9 @@ class DrawBuffer(FrameBuffer):
         x = 0
         y = r
 
-        self.pixel(cx, cy + r, color)
-        self.pixel(cx, cy - r, color)
-        self.pixel(cx + r, cy, color)
-        self.pixel(cx - r, cy, color)
+        # Collect the octant points, then plot them in one pass
+        pts = [cx, cy + r, cx, cy - r, cx + r, cy, cx - r, cy]
+        extend = pts.extend
 
         while x < y:
             if f >= 0:
@@ -179,18 +286,26 @@ class DrawBuffer(FrameBuffer):
             ddF_x += 2
             f += ddF_x
 
-            self.pixel(cx + x, cy + y, color)
-            self.pixel(cx - x, cy + y, color)
-            self.pixel(cx + x, cy - y, color)
-            self.pixel(cx - x, cy - y, color)
-            self.pixel(cx + y, cy + x, color)
-            self.pixel(cx - y, cy + x, color)
-            self.pixel(cx + y, cy - x, color)
-            self.pixel(cx - y, cy - x, color)
+            extend((cx + x, cy + y, cx - x, cy + y,
+                    cx + x, cy - y, cx - x, cy - y,
+                    cx + y, cy + x, cx - y, cy + x,
+                    cx + y, cy - x, cx - y, cy - x))
+
+        self._plot_points(pts, color)
 
     def fill_circle(self, cx: int, cy: int, r: int, color: int = BLACK) -> None:
-        """Draw filled circle using Bresenham's algorithm."""
-        self.vline(cx, cy - r, 2 * r + 1, color)
+        """Draw filled circle using Bresenham's algorithm.
+
+        The Bresenham walk records the half-height of the vertical span at
+        each column offset; the circle is then emitted as one hline per
+        row, so every row takes the byte-fill path.
+        """
+        if r < 0:
+            return
+
+        # half_h[k]: half-height of the span at column offset +-k
+        half_h = [-1] * (r + 1)
+        half_h[0] = r
 
         f = 1 - r
         ddF_x = 1
@@ -207,11 +322,19 @@ class DrawBuffer(FrameBuffer):
             ddF_x += 2
             f += ddF_x
 
-            # Draw horizontal lines between mirror points
-            self.vline(cx + x, cy - y, 2 * y + 1, color)
-            self.vline(cx - x, cy - y, 2 * y + 1, color)
-            self.vline(cx + y, cy - x, 2 * x + 1, color)
-            self.vline(cx - y, cy - x, 2 * x + 1, color)
+            if half_h[x] < y: half_h[x] = y
+            if half_h[y] < x: half_h[y] = x
+
+        # Half-heights shrink away from the center, so row offset t spans
+        # every column offset k with half_h[k] >= t
+        hline = self.hline
+        k = r
+        for t in range(r + 1):
+            while half_h[k] < t:
+                k -= 1
+            hline(cx - k, cy - t, 2 * k + 1, color)
+            if t:
+                hline(cx - k, cy + t, 2 * k + 1, color)
 
     # =========================================================================
     # Triangle
@@ -236,22 +359,56 @@ class DrawBuffer(FrameBuffer):
             self.hline(min_x, y0, max_x - min_x + 1, color)
             return
 
-        # Scanline fill
-        # Upper part
+        # Scanline fill with integer DDA edge walkers: each edge keeps
+        # x = floor(x_start + dx * t / dy) as a quotient plus remainder, so
+        # rows step without a multiply or divide. Edge b is the long edge
+        # v0->v2; edge a runs v0->v1, then switches to v1->v2 below y1.
+        # v1's side of the long edge (one cross product) fixes which edge
+        # is on the left for the whole triangle.
+        hline = self.hline
+        dyb = y2 - y0
+        qb, rb_step = divmod(x2 - x0, dyb)
+        xb, rb = x0, 0
+        a_right = (x1 - x0) * dyb > (x2 - x0) * (y1 - y0)
+
+        # Lower edge v1->v2, entered one row below y1
+        dyc = y2 - y1
+        if dyc:
+            qc, rc_step = divmod(x2 - x1, dyc)
+
         if y1 > y0:
-            for y in range(y0, y1 + 1):
-                xa = x0 + (x1 - x0) * (y - y0) // (y1 - y0)
-                xb = x0 + (x2 - x0) * (y - y0) // (y2 - y0)
-                if xa > xb: xa, xb = xb, xa
-                self.hline(xa, y, xb - xa + 1, color)
-
-        # Lower part
-        if y2 > y1:
-            for y in range(y1 + 1, y2 + 1):
-                xa = x1 + (x2 - x1) * (y - y1) // (y2 - y1)
-                xb = x0 + (x2 - x0) * (y - y0) // (y2 - y0)
-                if xa > xb: xa, xb = xb, xa
-                self.hline(xa, y, xb - xa + 1, color)
+            dya = y1 - y0
+            qa, ra_step = divmod(x1 - x0, dya)
+            xa, ra = x0, 0
+            y_start = y0
+        else:
+            # Flat top: start on the lower edge, long edge one row in
+            dya, qa, ra_step = dyc, qc, rc_step
+            xa, ra = x1 + qc, rc_step
+            xb += qb
+            rb += rb_step
+            if rb >= dyb:
+                xb += 1
+                rb -= dyb
+            y_start = y1 + 1
+
+        switch_y = y1 + 1 if y1 > y0 and dyc else None
+        for y in range(y_start, y2 + 1):
+            if y == switch_y:
+                dya, qa, ra_step = dyc, qc, rc_step
+                xa, ra = x1 + qc, rc_step
+            if a_right: hline(xb, y, xa - xb + 1, color)
+            else: hline(xa, y, xb - xa + 1, color)
+            xa += qa
+            ra += ra_step
+            if ra >= dya:
+                xa += 1
+                ra -= dya
+            xb += qb
+            rb += rb_step
+            if rb >= dyb:
+                xb += 1
+                rb -= dyb
 
     # =========================================================================
     # Rounded Rectangle
@@ -270,11 +427,15 @@ class DrawBuffer(FrameBuffer):
         self.vline(x, y + r, h - 2 * r, color)           # Left
         self.vline(x + w - 1, y + r, h - 2 * r, color)   # Right
 
-        # Corner arcs
+        # Corner arcs: collect the points, then plot them in one pass
         f = 1 - r
         ddF_x = 1
         ddF_y = -2 * r
         cx, cy = 0, r
+        left, top = x + r, y + r
+        right, bottom = x + w - 1 - r, y + h - 1 - r
+        pts = []
+        extend = pts.extend
 
         while cx < cy:
             if f >= 0:
@@ -285,21 +446,23 @@ class DrawBuffer(FrameBuffer):
             ddF_x += 2
             f += ddF_x
 
-            self.pixel(x + r - cx, y + r - cy, color)
-            self.pixel(x + r - cy, y + r - cx, color)
-            self.pixel(x + w - 1 - r + cx, y + r - cy, color)
-            self.pixel(x + w - 1 - r + cy, y + r - cx, color)
-            self.pixel(x + r - cx, y + h - 1 - r + cy, color)
-            self.pixel(x + r - cy, y + h - 1 - r + cx, color)
-            self.pixel(x + w - 1 - r + cx, y + h - 1 - r + cy, color)
-            self.pixel(x + w - 1 - r + cy, y + h - 1 - r + cx, color)
+            extend((left - cx, top - cy, left - cy, top - cx,
+                    right + cx, top - cy, right + cy, top - cx,
+                    left - cx, bottom + cy, left - cy, bottom + cx,
+                    right + cx, bottom + cy, right + cy, bottom + cx))
+
+        self._plot_points(pts, color)
 
     # =========================================================================
     # Bitmap Blit
     # =========================================================================
 
     def blit(self, bitmap: bytes, x: int, y: int, w: int, h: int, color: int = BLACK) -> None:
-        """Draw 1-bit bitmap with transparent background."""
+        """Draw 1-bit bitmap (or a prepared Sprite2) with transparent background."""
+        sprite = None
+        if isinstance(bitmap, Sprite2):
+            sprite = bitmap
+            bitmap, w, h = sprite.bitmap, sprite.w, sprite.h
         if x >= self.width or y >= self.height or x + w <= 0 or y + h <= 0: return
 
         # Clip
@@ -314,56 +477,192 @@ class DrawBuffer(FrameBuffer):
 
         if self.depth == 1:
             self._blit_1bit(ctx, bitmap, w, x, y, row_start, row_end, col_start, col_end)
+        elif sprite is not None and sprite.rotation == self._rotation:
+            self._blit_2bit_packed(ctx, sprite, x, y)
         else:
             self._blit_2bit(ctx, bitmap, w, x, y, row_start, row_end, col_start, col_end)
 
+    def prepare_2bit_sprite(self, bitmap: bytes, w: int, h: int) -> Sprite2:
+        """Pre-expand a 1-bit bitmap for fast repeated blits on this buffer.
+
+        The result is tied to the current rotation; blitting it after a
+        rotation change (or onto a 1-bit buffer) uses the normal path.
+        """
+        a, b, _, d, e, _ = self._rot_affine
+        pw, ph = (h, w) if b else (w, h)
+        # Offsets that put the flipped axes back into [0, pw) x [0, ph)
+        ox = pw - 1 if a + b < 0 else 0
+        oy = ph - 1 if d + e < 0 else 0
+        row_bytes = (pw * 2 + 7) // 8
+        mask = bytearray(row_bytes * ph)
+        src_row_bytes = (w + 7) // 8
+        src_bits = _BIT_MASKS
+
+        for row in range(h):
+            bmp_off = row * src_row_bytes
+            for col in range(w):
+                if bitmap[bmp_off + (col >> 3)] & src_bits[col & 7]:
+                    qx = a * col + b * row + ox
+                    qy = d * col + e * row + oy
+                    mask[qy * row_bytes + (qx >> 2)] |= _TWO_BIT_MASK << (_TWO_BIT_SHIFT_BASE - ((qx & 3) << 1))
+
+        return Sprite2(bitmap, w, h, self._rotation, pw, ph, row_bytes, bytes(mask))
+
     def _blit_1bit(self, ctx, bmp, w, x, y, r_start, r_end, c_start, c_end):
-        buf, pw, ph, stride, (swap, xf, yf), col, _ = ctx
+        buf, _, _, stride, _, col, _ = ctx
+        a, b, c, d, e, f = self._rot_affine
         row_bytes = (w + 7) // 8
 
-        # Unrolled Logic
-        if not swap:
-            dx_start = pw - 1 - x if xf else x
-            dx_step = -1 if xf else 1
-            dy_start = ph - 1 - y if yf else y
-            dy_step = -1 if yf else 1
-
+        # Clip masks for the first and last source byte of each row
+        i0 = c_start >> 3
+        i1 = (c_end - 1) >> 3
+        first_mask = 0xFF >> (c_start & 7)
+        last_mask = (0xFF << (7 - ((c_end - 1) & 7))) & 0xFF
+
+        if (a, b, d, e) == (1, 0, 0, 1):
+            # Unrotated: each clipped source row is read as one big-endian
+            # int, shifted to the destination bit offset and combined with
+            # the covered destination bytes in a single int operation
+            n = i1 - i0 + 1
+            je = c_end - 1 - (i0 << 3)
+            clip = ((1 << ((n << 3) - (c_start & 7))) - 1) ^ ((1 << ((n << 3) - 1 - je)) - 1)
+            dpx = x + (i0 << 3)
+            k0 = dpx >> 3
+            shift = 8 - (dpx & 7)  # Source int spans n + 1 destination bytes
+            nb = n + 1
+            if k0 < 0:
+                # Leading byte is left of the buffer (holds clipped bits only)
+                nb -= 1
+                k0 = 0
+            tail = k0 + nb - stride
+            if tail > 0:
+                # Trailing byte(s) past the row end hold clipped bits only
+                nb -= tail
+                shift -= tail << 3
+            keep = (1 << (nb << 3)) - 1
+            mv = self._mv
+            src = memoryview(bmp)
             for row in range(r_start, r_end):
-                py = dy_start + (row * dy_step)
                 bmp_off = row * row_bytes
-                row_off = py * stride
-                for col_idx in range(c_start, c_end):
-                    if not (bmp[bmp_off + (col_idx >> 3)] & (0x80 >> (col_idx & 7))): continue
-                    px = dx_start + (col_idx * dx_step)
-                    idx = row_off + (px >> 3)
-                    if col: buf[idx] |= _BIT_MASKS[px & 7]
-                    else:   buf[idx] &= _INV_MASKS[px & 7]
-        else:
-            dx_start = pw - 1 - y if xf else y
-            dx_step = -1 if xf else 1
-            dy_start = ph - 1 - x if yf else x
-            dy_step = -1 if yf else 1
+                v = int.from_bytes(src[bmp_off + i0:bmp_off + i1 + 1], 'big') & clip
+                if not v: continue
+                v = (v << shift if shift >= 0 else v >> -shift) & keep
+                k = (y + row) * stride + k0
+                dst = int.from_bytes(mv[k:k + nb], 'big')
+                dst = dst | v if col else dst & ~v
+                buf[k:k + nb] = dst.to_bytes(nb, 'big')
+            return
 
+        bit_masks = _BIT_MASKS
+        inv_masks = _INV_MASKS
+        lsb_col = _LSB_COL
+
+        if a == 0:
+            # Swapped (90/270): a source row is one physical column, so its
+            # byte column and bit mask are fixed and each source column
+            # steps a whole buffer row (d * stride)
+            step = d * stride
             for row in range(r_start, r_end):
-                px = dx_start + (row * dx_step)
+                ly = y + row
+                px = b * ly + c
+                idx_row = (d * x + f) * stride + (px >> 3)
                 bmp_off = row * row_bytes
-                for col_idx in range(c_start, c_end):
-                    if not (bmp[bmp_off + (col_idx >> 3)] & (0x80 >> (col_idx & 7))): continue
-                    py = dy_start + (col_idx * dy_step)
-                    idx = py * stride + (px >> 3)
-                    if col: buf[idx] |= _BIT_MASKS[px & 7]
-                    else:   buf[idx] &= _INV_MASKS[px & 7]
+                if col: mask = bit_masks[px & 7]
+                else: mask = inv_masks[px & 7]
+                for i in range(i0, i1 + 1):
+                    m = bmp[bmp_off + i]
+                    if i == i0: m &= first_mask
+                    if i == i1: m &= last_mask
+                    if not m: continue
+                    base = i << 3
+                    while m:
+                        lsb = m & -m
+                        m ^= lsb
+                        idx = idx_row + step * (base + lsb_col[lsb])
+                        if col: buf[idx] |= mask
+                        else: buf[idx] &= mask
+            return
+
+        # Flipped (180): a source row is one physical row, stepping
+        # backwards through it. Visits set source bits only.
+        for row in range(r_start, r_end):
+            px_row = a * x + c
+            row_off = (e * (y + row) + f) * stride
+            bmp_off = row * row_bytes
+            for i in range(i0, i1 + 1):
+                m = bmp[bmp_off + i]
+                if i == i0: m &= first_mask
+                if i == i1: m &= last_mask
+                if not m: continue
+                base = i << 3
+                while m:
+                    lsb = m & -m
+                    m ^= lsb
+                    px = px_row + a * (base + lsb_col[lsb])
+                    idx = row_off + (px >> 3)
+                    if col: buf[idx] |= bit_masks[px & 7]
+                    else:   buf[idx] &= inv_masks[px & 7]
+
+    def _blit_2bit_packed(self, ctx, sprite, x, y):
+        # Physical rows of the sprite mask are merged into the buffer as
+        # single ints: dst = (dst & ~m) | (m & color pattern)
+        buf, phys_w, phys_h, _, _, color, _ = ctx
+        qx, qy, pw, ph = self.transform_region(x, y, sprite.w, sprite.h)
+        r0 = max(0, -qy)
+        r1 = min(ph, phys_h - qy)
+        c0 = max(0, -qx)
+        c1 = min(pw, phys_w - qx)
+        if r0 >= r1 or c0 >= c1: return
+
+        rb = sprite.row_bytes
+        mask = memoryview(sprite.mask)
+        mv = self._mv
+        bits = rb << 3
+        # Keep columns [c0, c1), then drop the bits right of column c1 - 1
+        clip = ((1 << (bits - (c0 << 1))) - 1) ^ ((1 << (bits - (c1 << 1))) - 1)
+        drop = bits - (c1 << 1)
+        span = (c1 - c0) << 1
+        pattern = int.from_bytes(bytes(((color & _TWO_BIT_MASK) * _TWO_BIT_FILL,)) * ((span >> 3) + 2), 'big')
+
+        for r in range(r0, r1):
+            m = int.from_bytes(mask[r * rb:(r + 1) * rb], 'big') & clip
+            if not m: continue
+            start = ((qy + r) * phys_w + qx + c0) << 1
+            end = start + span
+            k0 = start >> 3
+            k1 = (end + 7) >> 3
+            nb = k1 - k0
+            m = (m >> drop) << ((k1 << 3) - end)
+            dst = int.from_bytes(mv[k0:k1], 'big')
+            buf[k0:k1] = ((dst & ~m) | (m & pattern)).to_bytes(nb, 'big')
 
     def _blit_2bit(self, ctx, bmp, w, x, y, r_start, r_end, c_start, c_end):
-        # Fallback to safe pixel setting for 2-bit
-        # (Could be optimized further, but 2-bit blit is rare)
+        # Same affine walk as _blit_1bit with the 2-bit physical setter:
+        # one load per source byte, zero bytes skipped, set bits walked
         row_bytes = (w + 7) // 8
-        color = ctx[5] # effective color
+        color = ctx[5]  # effective color
+        a, b, c, d, e, f = self._rot_affine
+        set_pixel = self._set_pixel_2bit
+        lsb_col = _LSB_COL
+
+        i0 = c_start >> 3
+        i1 = (c_end - 1) >> 3
+        first_mask = 0xFF >> (c_start & 7)
+        last_mask = (0xFF << (7 - ((c_end - 1) & 7))) & 0xFF
 
-        # We need to call internal physical setter manually or use logical pixel()
-        # Using logical pixel() for simplicity as 2-bit isn't the speed bottleneck
         for row in range(r_start, r_end):
+            ly = y + row
+            px_row = a * x + b * ly + c
+            py_row = d * x + e * ly + f
             bmp_off = row * row_bytes
-            for col_idx in range(c_start, c_end):
-                if bmp[bmp_off + (col_idx >> 3)] & (0x80 >> (col_idx & 7)):
-                    self.pixel_fast(x + col_idx, y + row, color)
+            for i in range(i0, i1 + 1):
+                m = bmp[bmp_off + i]
+                if i == i0: m &= first_mask
+                if i == i1: m &= last_mask
+                if not m: continue
+                base = i << 3
+                while m:
+                    lsb = m & -m
+                    m ^= lsb
+                    col_idx = base + lsb_col[lsb]
+                    set_pixel(px_row + a * col_idx, py_row + d * col_idx, color)
@@ -17,6 +17,11 @@ try:
 except ImportError:
     TYPE_CHECKING = False
 
+try:
+    from gc import mem_free
+except ImportError:
+    mem_free = None  # CPython: no heap limit to respect
+
 # =============================================================================
 # Color Constants
 # =============================================================================
@@ -32,14 +37,9 @@ WHITE = 3
 
 _BITS_PER_BYTE = 8
 _BYTE_MASK = 0xFF
-_BYTE_ZERO = 0x00
 _TWO_BIT_MASK = 0b11
 _TWO_BIT_FILL = 0x55  # Pattern for 2-bit value repeated 4x per byte
 
-# Byte literals for fast buffer slice filling
-_FILL_WHITE = b'\xff'  # All bits set (white in 1-bit mode)
-_FILL_BLACK = b'\x00'  # No bits set (black in 1-bit mode)
-
 # Pixel thresholds for grayscale conversion
 _MONO_THRESHOLD = 2  # Values >= 2 (LIGHT_GRAY, WHITE) map to white in mono
 
@@ -47,6 +47,11 @@ _MONO_THRESHOLD = 2  # Values >= 2 (LIGHT_GRAY, WHITE) map to white in mono
 _PIXELS_PER_BYTE_2BIT = 4
 _TWO_BIT_SHIFT_BASE = 6  # Starting shift for first 2-bit pixel in byte
 
+# Shift and keep-mask per pixel slot in a byte (pixel index & 3); the slot
+# depends only on the linear pixel index, so this holds for any width
+_TWO_BIT_SHIFTS = (6, 4, 2, 0)
+_TWO_BIT_KEEP = (0x3F, 0xCF, 0xF3, 0xFC)
+
 # =============================================================================
 # Internal Lookup Tables
 # =============================================================================
@@ -54,6 +59,14 @@ _TWO_BIT_SHIFT_BASE = 6  # Starting shift for first 2-bit pixel in byte
 _BIT_MASKS = tuple(1 << (7 - i) for i in range(_BITS_PER_BYTE))
 _INV_MASKS = tuple(~(1 << (7 - i)) & _BYTE_MASK for i in range(_BITS_PER_BYTE))
 
+# Effective color per (depth, inverted), indexed by color & 3
+_COLOR_MAP = {
+    (1, False): (BLACK, DARK_GRAY, LIGHT_GRAY, WHITE),
+    (2, False): (BLACK, DARK_GRAY, LIGHT_GRAY, WHITE),
+    (1, True): (WHITE, BLACK, BLACK, BLACK),
+    (2, True): (WHITE, LIGHT_GRAY, DARK_GRAY, BLACK),
+}
+
 _ROTATION = {
     0: (False, False, False),
     90: (True, True, False),
@@ -68,10 +81,11 @@ _ROTATION = {
 _LUT_MONO = None
 _LUT_BLACK = None
 _LUT_RED = None
+_LUT_PLANES = None  # Black nibble << 4 | red nibble
 
 def _init_luts():
     """Initialize LUTs on first use (lazy loading)."""
-    global _LUT_MONO, _LUT_BLACK, _LUT_RED
+    global _LUT_MONO, _LUT_BLACK, _LUT_RED, _LUT_PLANES
     if _LUT_MONO is not None:
         return
 
@@ -97,6 +111,84 @@ def _init_luts():
     _LUT_MONO = bytes(mono)
     _LUT_BLACK = bytes(black)
     _LUT_RED = bytes(red)
+    _LUT_PLANES = bytes((b << 4) | r for b, r in zip(black, red))
+
+
+# --- Lazy fused LUTs: one lookup per output byte (source byte pair) ---
+# 64 KB each, built per table on first use, and only while the heap has
+# room to spare; otherwise the 256-entry tables above are used directly.
+
+_LUT16_MIN_FREE = 256 * 1024
+
+# Source bytes compared per step when re-packing planes incrementally
+_PLANE_CHUNK = 256
+_LUT16 = {}
+
+
+def _fused_lut(lut):
+    """Return the 65536-entry pair table for lut, or None if memory is short."""
+    fused = _LUT16.get(id(lut))
+    if fused is None:
+        if mem_free is not None and mem_free() < _LUT16_MIN_FREE:
+            return None
+        hi = [v << 4 for v in lut]
+        fused = bytes(h | lo for h in hi for lo in lut)
+        _LUT16[id(lut)] = fused
+    return fused
+
+
+def _pack_pairs(buf, lut) -> bytes:
+    """Map each byte pair of a 2-bit buffer through lut into one output byte.
+
+    Pairs come from zipping one iterator with itself, so the loop is a
+    single generator feeding bytes() with no index arithmetic or stores.
+    """
+    it = iter(buf)
+    fused = _fused_lut(lut)
+    if fused is not None:
+        return bytes(fused[(hi << 8) | lo] for hi, lo in zip(it, it))
+    return bytes((lut[hi] << 4) | lut[lo] for hi, lo in zip(it, it))
+
+
+def _pack_pairs_into(buf, lut, dst) -> None:
+    """_pack_pairs writing into a caller-provided buffer (no allocation)."""
+    it = iter(buf)
+    fused = _fused_lut(lut)
+    i = 0
+    if fused is not None:
+        for hi, lo in zip(it, it):
+            dst[i] = fused[(hi << 8) | lo]
+            i += 1
+    else:
+        for hi, lo in zip(it, it):
+            dst[i] = (lut[hi] << 4) | lut[lo]
+            i += 1
+
+
+def _pack_planes_into(buf, black, red) -> None:
+    """Split a 2-bit buffer into black and red planes in a single pass.
+
+    Each source pair is read once; both plane bytes come from the combined
+    _LUT_PLANES nibbles, so one lookup per source byte serves both planes.
+    """
+    planes = _LUT_PLANES
+    it = iter(buf)
+    i = 0
+    for hi, lo in zip(it, it):
+        a = planes[hi]
+        c = planes[lo]
+        black[i] = (a & 0xF0) | (c >> 4)
+        red[i] = ((a & 0x0F) << 4) | (c & 0x0F)
+        i += 1
+
+
+def _pack_planes(buf) -> tuple:
+    """Allocating form of _pack_planes_into."""
+    n = len(buf) >> 1
+    black = bytearray(n)
+    red = bytearray(n)
+    _pack_planes_into(buf, black, red)
+    return bytes(black), bytes(red)
 
 
 class FrameBuffer:
@@ -116,12 +208,35 @@ class FrameBuffer:
         total_bits = phys_width * phys_height * depth
         self._buffer_size = (total_bits + 7) // 8
         self._buffer = bytearray(self._buffer_size)
+        # Zero-copy view for slice reads in the hot paths (the buffer is
+        # never reallocated, so one view lives as long as the object)
+        self._mv = memoryview(self._buffer)
         self._row_bytes = (phys_width * depth + 7) // 8
+        # One row of each color's fill byte, indexed by (effective) color;
+        # span fills take zero-copy slices instead of building a pattern
+        fill_byte = _BYTE_MASK if depth == 1 else _TWO_BIT_FILL
+        self._row_fill = tuple(memoryview(bytes((v * fill_byte,)) * self._row_bytes)
+                               for v in range(1 << depth))
 
         self._inverted = False
+        self._color_map = _COLOR_MAP[(depth, False)]
+
+        # Converted output is cached until the next write; every write path
+        # (and any hand-out of the raw buffer) sets _dirty
+        self._dirty = True
+        self._mono_cache = None
+        self._planes_cache = None
+        # Last caller buffers filled by to_mono_into / to_planes_into
+        self._mono_into = None
+        self._planes_into = None
+        # Plane buffers last filled by to_planes_into and the 2-bit source
+        # they were packed from (kept across writes for incremental packing)
+        self._planes_target = None
+        self._planes_src = None
 
         # Cache for rotation properties
         self._rot_props = (False, False, False)
+        self._rot_affine = (1, 0, 0, 0, 1, 0)
         self._rotation = 0
         self.rotation = rotation
 
@@ -147,10 +262,66 @@ class FrameBuffer:
     def rotation(self, value: int):
         self._rotation = value % 360
         self._rot_props = _ROTATION[self._rotation]
+        # Scalar copies for the per-call paths (no tuple unpack)
+        self._swap, self._xflip, self._yflip = self._rot_props
+        self._rot_affine = self._compute_affine()
         self._update_dimensions()
+        self._bind_pixel_fast()
+
+    def _compute_affine(self) -> tuple:
+        """Logical -> physical map as (a, b, c, d, e, f).
+
+        px = a*x + b*y + c, py = d*x + e*y + f
+        """
+        is_swapped, x_flip, y_flip = self._rot_props
+        sx = -1 if x_flip else 1
+        sy = -1 if y_flip else 1
+        c = self._phys_w - 1 if x_flip else 0
+        f = self._phys_h - 1 if y_flip else 0
+        if is_swapped:
+            return (0, sx, c, sy, 0, f)
+        return (sx, 0, c, 0, sy, f)
+
+    def _bind_pixel_fast(self) -> None:
+        """Shadow pixel_fast with a closure specialized for the rotation.
+
+        The flip/swap is baked into each variant, so the per-pixel path
+        skips the rotation tuple unpack and both conditional flips.
+        """
+        set_pixel = self._set_pixel_1bit if self._depth == 1 else self._set_pixel_2bit
+        max_x = self._phys_w - 1
+        max_y = self._phys_h - 1
+        rotation = self._rotation
+
+        if rotation == 0:
+            def pixel_fast(x, y, color=BLACK):
+                self._dirty = True
+                set_pixel(x, y, self._color_map[color & _TWO_BIT_MASK])
+        elif rotation == 90:
+            def pixel_fast(x, y, color=BLACK):
+                self._dirty = True
+                set_pixel(max_x - y, x, self._color_map[color & _TWO_BIT_MASK])
+        elif rotation == 180:
+            def pixel_fast(x, y, color=BLACK):
+                self._dirty = True
+                set_pixel(max_x - x, max_y - y, self._color_map[color & _TWO_BIT_MASK])
+        else:
+            def pixel_fast(x, y, color=BLACK):
+                self._dirty = True
+                set_pixel(y, max_y - x, self._color_map[color & _TWO_BIT_MASK])
+
+        self.pixel_fast = pixel_fast
 
     @property
-    def buffer(self) -> bytearray: return self._buffer
+    def buffer(self) -> bytearray:
+        """Raw pixel bytes, for direct writes.
+
+        Fetching it marks the converted caches stale, but writes through a
+        reference kept across a to_mono/to_planes call are not seen: re-fetch
+        .buffer (or get_blit_context()) before writing again.
+        """
+        self._dirty = True  # Caller may write to it
+        return self._buffer
 
     @property
     def is_inverted(self) -> bool: return self._inverted
@@ -160,86 +331,90 @@ class FrameBuffer:
     # =========================================================================
 
     def _transform(self, x: int, y: int) -> tuple[int, int]:
-        is_swapped, x_flip, y_flip = self._rot_props
-        if is_swapped: x, y = y, x
-        if x_flip: x = self._phys_w - 1 - x
-        if y_flip: y = self._phys_h - 1 - y
+        if self._swap: x, y = y, x
+        if self._xflip: x = self._phys_w - 1 - x
+        if self._yflip: y = self._phys_h - 1 - y
         return x, y
 
     def transform_region(self, x: int, y: int, w: int, h: int) -> tuple[int, int, int, int]:
-        is_swapped, x_flip, y_flip = self._rot_props
-        if is_swapped: x, y, w, h = y, x, h, w
-        if x_flip: x = self._phys_w - x - w
-        if y_flip: y = self._phys_h - y - h
+        if self._swap: x, y, w, h = y, x, h, w
+        if self._xflip: x = self._phys_w - x - w
+        if self._yflip: y = self._phys_h - y - h
         return x, y, w, h
 
+    # Single-pixel paths shift the mask inline (0x80 >> bit) rather than
+    # loading a global table and indexing it on every call, and select the
+    # bit without branching: -(color != 0) is all ones for white, 0 for black
     def _set_pixel_1bit(self, px: int, py: int, color: int) -> None:
         idx = py * self._row_bytes + (px >> 3)
-        bit = px & 7
-        if color: self._buffer[idx] |= _BIT_MASKS[bit]
-        else: self._buffer[idx] &= _INV_MASKS[bit]
+        mask = 0x80 >> (px & 7)
+        buf = self._buffer
+        buf[idx] = (buf[idx] & (_BYTE_MASK ^ mask)) | (-(color != 0) & mask)
 
     def _get_pixel_1bit(self, px: int, py: int) -> int:
         idx = py * self._row_bytes + (px >> 3)
-        return WHITE if (self._buffer[idx] & _BIT_MASKS[px & 7]) else BLACK
+        return WHITE if (self._buffer[idx] & (0x80 >> (px & 7))) else BLACK
 
     def _set_pixel_2bit(self, px: int, py: int, color: int) -> None:
-        bit_off = (py * self._phys_w + px) * 2
-        byte_idx = bit_off >> 3
-        bit_pos = _TWO_BIT_SHIFT_BASE - (bit_off & 7)
-        mask = ~(_TWO_BIT_MASK << bit_pos) & _BYTE_MASK
-        self._buffer[byte_idx] = (self._buffer[byte_idx] & mask) | ((color & _TWO_BIT_MASK) << bit_pos)
+        off = py * self._phys_w + px
+        idx = off >> 2
+        slot = off & 3
+        self._buffer[idx] = (self._buffer[idx] & _TWO_BIT_KEEP[slot]) | ((color & _TWO_BIT_MASK) << _TWO_BIT_SHIFTS[slot])
 
     def _get_pixel_2bit(self, px: int, py: int) -> int:
-        bit_off = (py * self._phys_w + px) * 2
-        return (self._buffer[bit_off >> 3] >> (_TWO_BIT_SHIFT_BASE - (bit_off & 7))) & _TWO_BIT_MASK
+        off = py * self._phys_w + px
+        return (self._buffer[off >> 2] >> _TWO_BIT_SHIFTS[off & 3]) & _TWO_BIT_MASK
 
     # --- Physical pixel setters (for DrawBuffer's optimized loops) ---
     def _set_pixel_1bit_phys(self, px: int, py: int, color: int) -> None:
         """Set 1-bit pixel at physical coords (no transform, no bounds check)."""
+        self._dirty = True
         idx = py * self._row_bytes + (px >> 3)
-        if color:
-            self._buffer[idx] |= _BIT_MASKS[px & 7]
-        else:
-            self._buffer[idx] &= _INV_MASKS[px & 7]
+        mask = 0x80 >> (px & 7)
+        buf = self._buffer
+        buf[idx] = (buf[idx] & (_BYTE_MASK ^ mask)) | (-(color != 0) & mask)
 
     def _set_pixel_2bit_phys(self, px: int, py: int, color: int) -> None:
         """Set 2-bit pixel at physical coords (no transform, no bounds check)."""
-        off = (py * self._phys_w + px) * 2
-        idx = off >> 3
-        shift = _TWO_BIT_SHIFT_BASE - (off & 7)
-        self._buffer[idx] = (self._buffer[idx] & ~(_TWO_BIT_MASK << shift)) | ((color & _TWO_BIT_MASK) << shift)
+        self._dirty = True
+        off = py * self._phys_w + px
+        idx = off >> 2
+        slot = off & 3
+        self._buffer[idx] = (self._buffer[idx] & _TWO_BIT_KEEP[slot]) | ((color & _TWO_BIT_MASK) << _TWO_BIT_SHIFTS[slot])
 
     def pixel(self, x: int, y: int, color: int = BLACK) -> None:
         if not (0 <= x < self.width and 0 <= y < self.height): return
 
-        is_swapped, x_flip, y_flip = self._rot_props
-        if is_swapped: x, y = y, x
-        px = (self._phys_w - 1 - x) if x_flip else x
-        py = (self._phys_h - 1 - y) if y_flip else y
+        if self._swap: x, y = y, x
+        px = (self._phys_w - 1 - x) if self._xflip else x
+        py = (self._phys_h - 1 - y) if self._yflip else y
 
-        eff = self._effective_color(color)
+        eff = self._color_map[color & _TWO_BIT_MASK]
+        self._dirty = True
         if self._depth == 1: self._set_pixel_1bit(px, py, eff)
         else: self._set_pixel_2bit(px, py, eff)
 
     def get_pixel(self, x: int, y: int) -> int:
         if not (0 <= x < self.width and 0 <= y < self.height): return WHITE
         # Inline transform to avoid function call overhead
-        is_swapped, x_flip, y_flip = self._rot_props
-        if is_swapped: x, y = y, x
-        px = (self._phys_w - 1 - x) if x_flip else x
-        py = (self._phys_h - 1 - y) if y_flip else y
+        if self._swap: x, y = y, x
+        px = (self._phys_w - 1 - x) if self._xflip else x
+        py = (self._phys_h - 1 - y) if self._yflip else y
         if self._depth == 1: return self._get_pixel_1bit(px, py)
         else: return self._get_pixel_2bit(px, py)
 
     def pixel_fast(self, x: int, y: int, color: int = BLACK) -> None:
-        """Set pixel without bounds checking (faster for known-safe coords)."""
+        """Set pixel without bounds checking (faster for known-safe coords).
+
+        Instances replace this with a rotation-specialized closure (see
+        _bind_pixel_fast); this generic version documents the behavior.
+        """
         # Inline transform to avoid function call overhead in MicroPython
-        is_swapped, x_flip, y_flip = self._rot_props
-        if is_swapped: x, y = y, x
-        px = (self._phys_w - 1 - x) if x_flip else x
-        py = (self._phys_h - 1 - y) if y_flip else y
-        eff = self._effective_color(color)
+        if self._swap: x, y = y, x
+        px = (self._phys_w - 1 - x) if self._xflip else x
+        py = (self._phys_h - 1 - y) if self._yflip else y
+        eff = self._color_map[color & _TWO_BIT_MASK]
+        self._dirty = True
         if self._depth == 1: self._set_pixel_1bit(px, py, eff)
         else: self._set_pixel_2bit(px, py, eff)
 
@@ -250,87 +425,96 @@ class FrameBuffer:
     def clear(self, color: int = WHITE) -> None:
         """Clear the buffer to a color, respecting inversion."""
         # Calculate effective color first to handle inversion
-        eff_color = self._effective_color(color)
+        eff_color = self._color_map[color & _TWO_BIT_MASK]
+        self._dirty = True
 
         if self._depth == 1:
-            fill = _BYTE_MASK if eff_color else _BYTE_ZERO
+            row = self._row_fill[1 if eff_color else 0]
         else:
-            # 2-bit packing: (color & 3) repeated 4 times
-            fill = (eff_color & _TWO_BIT_MASK) * _TWO_BIT_FILL
-
-        # Fast fill using slice assignment
-        # Creating a small pattern and multiplying is faster than a loop
-        self._buffer[:] = bytes((fill,)) * self._buffer_size
+            row = self._row_fill[eff_color & _TWO_BIT_MASK]
+
+        # Seed from the cached fill row, then double the filled prefix in
+        # place: ~log2(size) slice copies and no buffer-sized temporary
+        mv = self._mv
+        size = self._buffer_size
+        done = min(len(row), size)
+        mv[:done] = row[:done]
+        while done < size:
+            n = min(done, size - done)
+            mv[done:done + n] = mv[:n]
+            done += n
 
     def invert(self) -> None:
         """Software invert all buffer contents.
 
-        This XORs every byte in the buffer, useful for 2-bit grayscale mode.
+        This XORs every byte in the buffer (as one big-int operation), useful for 2-bit grayscale mode.
         For 1-bit mode with EPD displays, prefer using EPD.set_invert() or
         Canvas.invert_display() which uses hardware inversion - it's instant
         and doesn't require redrawing the buffer.
 
         Note: This is O(n) where n = buffer_size (4736 bytes for 296x128).
         """
-        buf = self._buffer
-        for i in range(self._buffer_size): buf[i] ^= _BYTE_MASK
+        # Whole buffer as one big int: a single XOR against all-ones
+        # replaces a Python-level loop over every byte
+        n = self._buffer_size
+        self._dirty = True
+        value = int.from_bytes(self._mv, 'big') ^ ((1 << (n << 3)) - 1)
+        self._buffer[:] = value.to_bytes(n, 'big')
         self._inverted = not self._inverted
-
-    def _effective_color(self, color: int) -> int:
-        """Apply inversion to color if buffer is in inverted state."""
-        if not self._inverted: return color
-        if self._depth == 1: return BLACK if color else WHITE
-        else: return (~color) & _TWO_BIT_MASK
+        self._color_map = _COLOR_MAP[(self._depth, self._inverted)]
 
     def get_blit_context(self, color: int = BLACK) -> tuple:
+        self._dirty = True  # Context holds the raw buffer for writing
         return (self._buffer, self._phys_w, self._phys_h, self._row_bytes,
-                self._rot_props, self._effective_color(color), self._depth)
+                self._rot_props, self._color_map[color & _TWO_BIT_MASK], self._depth)
 
     # =========================================================================
     # Internal Line Primitives
     # =========================================================================
 
     def hline(self, x: int, y: int, length: int, color: int = BLACK) -> None:
-        # (Standard implementation from previous optimized version)
+        # Attributes read more than once are bound to locals up front
+        width = self.width
         if length <= 0 or y < 0 or y >= self.height: return
-        if x >= self.width or x + length <= 0: return
+        if x >= width or x + length <= 0: return
         if x < 0: length += x; x = 0
-        if x + length > self.width: length = self.width - x
-        if length <= 0: return
+        if x + length > width: length = width - x
 
-        effective = self._effective_color(color)
-        is_swapped, x_flip, y_flip = self._rot_props
+        effective = self._color_map[color & _TWO_BIT_MASK]
+        phys_w, phys_h = self._phys_w, self._phys_h
 
-        if is_swapped:
-            px = (self._phys_w - 1 - y) if x_flip else y
-            py = (self._phys_h - x - length) if y_flip else x
+        if self._swap:
+            px = (phys_w - 1 - y) if self._xflip else y
+            py = (phys_h - x - length) if self._yflip else x
             self._vline_phys(px, py, length, effective)
         else:
-            px = (self._phys_w - x - length) if x_flip else x
-            py = (self._phys_h - 1 - y) if y_flip else y
+            px = (phys_w - x - length) if self._xflip else x
+            py = (phys_h - 1 - y) if self._yflip else y
             self._hline_phys(px, py, length, effective)
 
     def vline(self, x: int, y: int, length: int, color: int = BLACK) -> None:
+        height = self.height
         if length <= 0 or x < 0 or x >= self.width: return
         if y < 0: length += y; y = 0
-        if y + length > self.height: length = self.height - y
+        if y + length > height: length = height - y
         if length <= 0: return
 
-        effective = self._effective_color(color)
-        is_swapped, x_flip, y_flip = self._rot_props
+        effective = self._color_map[color & _TWO_BIT_MASK]
+        phys_w, phys_h = self._phys_w, self._phys_h
 
-        if is_swapped:
-            px = (self._phys_w - y - length) if x_flip else y
-            py = (self._phys_h - 1 - x) if y_flip else x
+        if self._swap:
+            px = (phys_w - y - length) if self._xflip else y
+            py = (phys_h - 1 - x) if self._yflip else x
             self._hline_phys(px, py, length, effective)
         else:
-            px = (self._phys_w - 1 - x) if x_flip else x
-            py = (self._phys_h - y - length) if y_flip else y
+            px = (phys_w - 1 - x) if self._xflip else x
+            py = (phys_h - y - length) if self._yflip else y
             self._vline_phys(px, py, length, effective)
 
     def _hline_phys(self, px: int, py: int, length: int, color: int) -> None:
+        self._dirty = True
         if self._depth == 2:
-            for i in range(length): self._set_pixel_2bit(px + i, py, color)
+            self._hline_phys_2bit(px, py, length, color)
             return
 
         # 1-bit optimization
@@ -350,34 +534,66 @@ class FrameBuffer:
             else: buf[row + b0] &= start_mask ^ _BYTE_MASK
 
             if b1 > b0 + 1:
-                fill = _FILL_WHITE if color else _FILL_BLACK
-                buf[row + b0 + 1:row + b1] = fill * (b1 - b0 - 1)
+                buf[row + b0 + 1:row + b1] = self._row_fill[1 if color else 0][:b1 - b0 - 1]
 
             end_mask = (_BYTE_MASK << (7 - bit1)) & _BYTE_MASK
             if color: buf[row + b1] |= end_mask
             else: buf[row + b1] &= end_mask ^ _BYTE_MASK
 
+    def _hline_phys_2bit(self, px: int, py: int, length: int, color: int) -> None:
+        # Four pixels per byte: the partial first and last bytes take one
+        # masked write each, the whole bytes between are slice-filled
+        buf = self._buffer
+        start = py * self._phys_w + px
+        end = start + length - 1
+        b0, p0 = start >> 2, start & 3
+        b1, p1 = end >> 2, end & 3
+        rep = (color & _TWO_BIT_MASK) * _TWO_BIT_FILL
+        head = _BYTE_MASK >> (p0 << 1)
+        tail = (_BYTE_MASK << ((3 - p1) << 1)) & _BYTE_MASK
+
+        if b0 == b1:
+            mask = head & tail
+            buf[b0] = (buf[b0] & (mask ^ _BYTE_MASK)) | (rep & mask)
+            return
+
+        buf[b0] = (buf[b0] & (head ^ _BYTE_MASK)) | (rep & head)
+        if b1 > b0 + 1:
+            buf[b0 + 1:b1] = self._row_fill[color & _TWO_BIT_MASK][:b1 - b0 - 1]
+        buf[b1] = (buf[b1] & (tail ^ _BYTE_MASK)) | (rep & tail)
+
     def _vline_phys(self, px: int, py: int, length: int, color: int) -> None:
+        self._dirty = True
+        buf = self._buffer
         if self._depth == 2:
-            for i in range(length): self._set_pixel_2bit(px, py + i, color)
+            if self._phys_w & 3:
+                # Rows not byte-aligned: the shift changes down the column
+                for i in range(length): self._set_pixel_2bit(px, py + i, color)
+                return
+            row_bytes = self._row_bytes
+            shift = _TWO_BIT_SHIFT_BASE - ((px & 3) << 1)
+            keep = ~(_TWO_BIT_MASK << shift) & _BYTE_MASK
+            value = (color & _TWO_BIT_MASK) << shift
+            start = py * row_bytes + (px >> 2)
+            for idx in range(start, start + length * row_bytes, row_bytes):
+                buf[idx] = (buf[idx] & keep) | value
             return
 
-        buf = self._buffer
         row_bytes = self._row_bytes
         byte_col = px >> 3
         mask = _BIT_MASKS[px & 7]
         inv = _INV_MASKS[px & 7]
 
-        # Calculate starting index and stride to avoid multiplication in loop
-        idx = py * row_bytes + byte_col
+        # The strided range yields each byte index directly, so the loop
+        # body is the read-modify-write alone
+        start = py * row_bytes + byte_col
+        stop = start + length * row_bytes
         if color:
-            for _ in range(length):
+            for idx in range(start, stop, row_bytes):
                 buf[idx] |= mask
-                idx += row_bytes
         else:
-            for _ in range(length):
+            for idx in range(start, stop, row_bytes):
                 buf[idx] &= inv
-                idx += row_bytes
 
     def get_region(self, x: int, y: int, w: int, h: int, physical: bool = False) -> bytearray:
         if not physical: x, y, w, h = self.transform_region(x, y, w, h)
@@ -385,56 +601,144 @@ class FrameBuffer:
         px, py, pw, ph = x, y, w, h
         if self._depth == 1:
             if px % _BITS_PER_BYTE != 0 or pw % _BITS_PER_BYTE != 0: raise ValueError("x/w must be multiple of 8")
-            region = bytearray(pw * ph // _BITS_PER_BYTE)
             src_stride = self._row_bytes
             dst_stride = pw // _BITS_PER_BYTE
             px_byte = px // _BITS_PER_BYTE
+            mv = self._mv  # Zero-copy source slices
+            if px_byte == 0 and dst_stride == src_stride:
+                # Full-width rows are contiguous: one copy for the block
+                start = py * src_stride
+                return bytearray(mv[start:start + ph * src_stride])
+            region = bytearray(pw * ph // _BITS_PER_BYTE)
             for row in range(ph):
                 src = (py + row) * src_stride + px_byte
                 dst = row * dst_stride
-                region[dst:dst + dst_stride] = self._buffer[src:src + dst_stride]
+                region[dst:dst + dst_stride] = mv[src:src + dst_stride]
             return region
         else:
-            region = bytearray(pw * ph * 2 // _BITS_PER_BYTE)
-            # 2-bit region extraction remains pixel-by-pixel for now
+            total = pw * ph * 2
+            region = bytearray((total + 7) // _BITS_PER_BYTE)
+            # Each row is pulled out of the packed buffer as one int of
+            # 2 * pw bits and shifted into a bit accumulator; whole output
+            # bytes are flushed after every row
+            mv = self._mv
+            phys_w = self._phys_w
+            span = pw * 2
+            keep = (1 << span) - 1
+            acc = nbits = pos = 0
             for row in range(ph):
-                for col in range(pw):
-                    val = self._get_pixel_2bit(px + col, py + row)
-                    bo = (row * pw + col) * 2
-                    region[bo >> 3] |= (val << (_TWO_BIT_SHIFT_BASE - (bo & 7)))
+                start = ((py + row) * phys_w + px) * 2
+                end = start + span
+                k1 = (end + 7) >> 3
+                bits = (int.from_bytes(mv[start >> 3:k1], 'big') >> ((k1 << 3) - end)) & keep
+                acc = (acc << span) | bits
+                nbits += span
+                whole = nbits >> 3
+                if whole:
+                    nbits &= 7
+                    region[pos:pos + whole] = (acc >> nbits).to_bytes(whole, 'big')
+                    acc &= (1 << nbits) - 1
+                    pos += whole
+            if nbits:
+                region[pos] = acc << (8 - nbits)
             return region
 
     # =========================================================================
     # Format Conversion (LUT Optimized)
     # =========================================================================
 
+    def _drop_stale_caches(self) -> None:
+        """Drop cached conversions if the buffer was written since."""
+        if self._dirty:
+            self._mono_cache = self._planes_cache = None
+            self._mono_into = self._planes_into = None
+            self._dirty = False
+
     def to_mono(self) -> bytes:
-        """Convert buffer to 1-bit packed bytes (Fast LUT)."""
+        """Convert buffer to 1-bit packed bytes (Fast LUT, cached until next write)."""
+        self._drop_stale_caches()
+        if self._mono_cache is None:
+            if self._depth == 1:
+                self._mono_cache = bytes(self._buffer)
+            else:
+                _init_luts()  # Lazy init
+                self._mono_cache = _pack_pairs(self._buffer, _LUT_MONO)
+        return self._mono_cache
+
+    def to_mono_into(self, dst: bytearray) -> None:
+        """Like to_mono, but write into dst (a reusable buffer of the output size).
+
+        Nothing is allocated. A 1-bit buffer is always copied; a 2-bit pack
+        is skipped if dst was the last target and the buffer has not been
+        written since (see the buffer property).
+        """
         if self._depth == 1:
-            return bytes(self._buffer)
-
+            dst[:] = self._mv
+            return
+        self._drop_stale_caches()
+        if self._mono_into is dst:
+            return
         _init_luts()  # Lazy init
-        buf = self._buffer
-        mono = bytearray(self._buffer_size // 2)
-
-        for i in range(0, self._buffer_size, 2):
-            mono[i // 2] = (_LUT_MONO[buf[i]] << 4) | _LUT_MONO[buf[i + 1]]
-
-        return bytes(mono)
+        _pack_pairs_into(self._buffer, _LUT_MONO, dst)
+        self._mono_into = dst
 
     def to_planes(self) -> tuple[bytes, bytes]:
         """Convert 2-bit buffer to bit planes (Fast LUT)."""
         if self._depth != 2:
             raise ValueError("depth=2 required")
 
+        self._drop_stale_caches()
+        if self._planes_cache is None:
+            _init_luts()  # Lazy init
+            buf = self._buffer
+            if _fused_lut(_LUT_BLACK) is not None and _fused_lut(_LUT_RED) is not None:
+                # One probe per output byte already; two streaming passes
+                self._planes_cache = (_pack_pairs(buf, _LUT_BLACK), _pack_pairs(buf, _LUT_RED))
+            else:
+                self._planes_cache = _pack_planes(buf)
+        return self._planes_cache
+
+    def to_planes_into(self, black: bytearray, red: bytearray) -> None:
+        """Like to_planes, but write into the given plane buffers (no allocation).
+
+        Refilling the same pair of buffers is incremental: only chunks of
+        the 2-bit buffer that changed since the last call are re-packed.
+        """
+        if self._depth != 2:
+            raise ValueError("depth=2 required")
+
+        self._drop_stale_caches()
+        last = self._planes_into
+        if last is not None and last[0] is black and last[1] is red:
+            return
         _init_luts()  # Lazy init
         buf = self._buffer
-        plane_size = self._buffer_size // 2
-        black = bytearray(plane_size)
-        red = bytearray(plane_size)
-
-        for i in range(0, self._buffer_size, 2):
-            black[i // 2] = (_LUT_BLACK[buf[i]] << 4) | _LUT_BLACK[buf[i + 1]]
-            red[i // 2] = (_LUT_RED[buf[i]] << 4) | _LUT_RED[buf[i + 1]]
-
-        return bytes(black), bytes(red)
+        target = self._planes_target
+        if target is not None and target[0] is black and target[1] is red:
+            self._repack_planes(black, red)
+        else:
+            if _fused_lut(_LUT_BLACK) is not None and _fused_lut(_LUT_RED) is not None:
+                _pack_pairs_into(buf, _LUT_BLACK, black)
+                _pack_pairs_into(buf, _LUT_RED, red)
+            else:
+                _pack_planes_into(buf, black, red)
+            self._planes_src = bytearray(buf)
+            self._planes_target = (black, red)
+        self._planes_into = (black, red)
+
+    def _repack_planes(self, black: bytearray, red: bytearray) -> None:
+        """Re-pack only the source chunks that differ from the last snapshot."""
+        buf = self._buffer
+        mv = self._mv
+        snap = self._planes_src
+        planes = _LUT_PLANES
+        size = self._buffer_size
+        for a in range(0, size, _PLANE_CHUNK):
+            b = min(a + _PLANE_CHUNK, size)
+            if buf[a:b] == snap[a:b]: continue
+            snap[a:b] = mv[a:b]
+            for i in range(a, b - 1, 2):
+                hi = planes[buf[i]]
+                lo = planes[buf[i + 1]]
+                black[i >> 1] = (hi & 0xF0) | (lo >> 4)
+                red[i >> 1] = ((hi & 0x0F) << 4) | (lo & 0x0F)
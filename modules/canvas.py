@@ -41,6 +41,48 @@ from buffer import BLACK, WHITE, DARK_GRAY, LIGHT_GRAY
 
 __all__ = ["Canvas", "BLACK", "WHITE", "DARK_GRAY", "LIGHT_GRAY"]
 
+# Printable ASCII (0x20-0x7E): covers menu labels and benchmark output.
+_PREWARM_CHARS = "".join(chr(c) for c in range(0x20, 0x7F))
+
+# Regions sharing rows and closer than this (px) are sent as one window
+_REGION_MERGE_GAP = 32
+
+
+def _merge_regions(regions: list, gap: int = _REGION_MERGE_GAP) -> list:
+    """
+    Union regions that overlap vertically and are within gap px horizontally.
+
+    Each merged region costs one window + data transfer instead of several;
+    the few extra gap pixels sent are cheaper than the per-region commands.
+    Edges of the union are edges of input regions, so byte alignment holds.
+
+    Args:
+        regions: List of (x, y, w, h) tuples in logical coordinates
+        gap: Maximum horizontal gap in pixels to bridge
+
+    Returns:
+        New list of (x, y, w, h) tuples
+    """
+    out = sorted((tuple(r) for r in regions), key=lambda r: (r[1], r[0]))
+    i = 0
+    while i < len(out):
+        x0, y0, w0, h0 = out[i]
+        for j in range(i + 1, len(out)):
+            x1, y1, w1, h1 = out[j]
+            if (y1 < y0 + h0 and y0 < y1 + h1
+                    and x1 - (x0 + w0) < gap and x0 - (x1 + w1) < gap):
+                nx = min(x0, x1)
+                ny = min(y0, y1)
+                out[i] = (nx, ny, max(x0 + w0, x1 + w1) - nx,
+                          max(y0 + h0, y1 + h1) - ny)
+                del out[j]
+                break
+        else:
+            i += 1
+            continue
+        i = 0  # Union grew: re-check against everything
+    return out
+
 
 class Canvas:
     """
@@ -107,6 +149,10 @@ class Canvas:
         if default_font:
             self.load_font(default_font)
 
+        # Reusable output buffers for refreshes (allocated on first use)
+        self._mono_out = None
+        self._planes_out = None
+
         self._closed = False
 
     def __enter__(self):
@@ -224,6 +270,18 @@ class Canvas:
         """Add an extension font (e.g. icons)."""
         return self._text.add_font(path, optional)
 
+    def prewarm_font(self, chars: str = _PREWARM_CHARS):
+        """
+        Load glyphs into the cache ahead of time.
+
+        Call once after load_font() so the first text() draw doesn't pay
+        the flash read latency for every new character.
+
+        Args:
+            chars: Characters to preload (default: printable ASCII).
+        """
+        self._text.preload_glyphs(chars)
+
     def text(
         self,
         string: str,
@@ -246,6 +304,22 @@ class Canvas:
     # Display Updates
     # =========================================================================
 
+    def _mono_frame(self) -> bytearray:
+        """Buffer contents as 1-bit data, in a reused output buffer."""
+        if self._mono_out is None:
+            self._mono_out = bytearray(self._driver.BUFFER_SIZE)
+        self._buffer.to_mono_into(self._mono_out)
+        return self._mono_out
+
+    def _plane_frames(self) -> tuple:
+        """Buffer contents as black/red planes, in reused output buffers."""
+        if self._planes_out is None:
+            size = self._driver.BUFFER_SIZE
+            self._planes_out = (bytearray(size), bytearray(size))
+        black, red = self._planes_out
+        self._buffer.to_planes_into(black, red)
+        return black, red
+
     def full_refresh(self) -> float:
         """
         Full display refresh - clears ghosting, establishes basemap.
@@ -257,10 +331,10 @@ class Canvas:
             Refresh time in seconds
         """
         if self._buffer.depth == 2:
-            black, red = self._buffer.to_planes()
+            black, red = self._plane_frames()
             return self._driver.display_gray(black, red)
         else:
-            mono = self._buffer.to_mono()
+            mono = self._mono_frame()
             return self._driver.display(mono, full=True, stay_awake=False)
 
     def partial_refresh(self) -> float:
@@ -275,10 +349,10 @@ class Canvas:
             Refresh time in seconds
         """
         if self._buffer.depth == 2:
-            black, red = self._buffer.to_planes()
+            black, red = self._plane_frames()
             return self._driver.display_gray(black, red)
         else:
-            mono = self._buffer.to_mono()
+            mono = self._mono_frame()
             return self._driver.display(mono, full=False, stay_awake=True)
 
     def custom_refresh(self, lut: bytes) -> float:
@@ -292,10 +366,10 @@ class Canvas:
             Refresh time in seconds
         """
         if self._buffer.depth == 2:
-            black, red = self._buffer.to_planes()
+            black, red = self._plane_frames()
             return self._driver.display_lut(lut, black, red)
         else:
-            mono = self._buffer.to_mono()
+            mono = self._mono_frame()
             return self._driver.display_lut(lut, mono)
 
     def refresh(self, force_full: bool = False) -> float:
@@ -309,10 +383,10 @@ class Canvas:
             Refresh time in seconds
         """
         if self._buffer.depth == 2:
-            black, red = self._buffer.to_planes()
+            black, red = self._plane_frames()
             return self._driver.display_gray(black, red)
         else:
-            mono = self._buffer.to_mono()
+            mono = self._mono_frame()
             return self._driver.display(
                 mono,
                 full=False,
@@ -329,12 +403,16 @@ class Canvas:
         region = self._buffer.get_region(px, py, pw, ph, physical=True)
         return self._driver.display_region(region, px, py, pw, ph)
 
-    def update_regions(self, regions: list) -> float:
+    def update_regions(self, regions: list, strict: bool = False) -> float:
         """
         Batch update multiple regions with a single refresh.
 
+        Nearby regions on the same rows are merged into one window first
+        (see _merge_regions) unless strict is set.
+
         Args:
             regions: List of (x, y, w, h) tuples
+            strict: Send regions exactly as given (no merging)
 
         Returns:
             Refresh time in seconds
@@ -342,6 +420,9 @@ class Canvas:
         if self._buffer.depth != 1:
             raise ValueError("Region update only supported in 1-bit mode")
 
+        if not strict:
+            regions = _merge_regions(regions)
+
         driver_regions = []
         for x, y, w, h in regions:
             px, py, pw, ph = self._buffer.transform_region(x, y, w, h)
@@ -435,10 +516,10 @@ class Canvas:
             stay_awake = not full
 
         if self._buffer.depth == 2:
-            black, red = self._buffer.to_planes()
+            black, red = self._plane_frames()
             return self._driver.display_gray(black, red)
         else:
-            mono = self._buffer.to_mono()
+            mono = self._mono_frame()
             return self._driver.display(
                 mono,
                 full=full,
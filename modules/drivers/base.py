@@ -29,6 +29,10 @@ class DisplayDriver:
         HEIGHT: Physical display height in pixels
         BUFFER_SIZE: Required buffer size in bytes
         state: Current DriverState
+
+    Image data arguments accept any buffer-protocol object (bytes,
+    bytearray, memoryview, array) and are sent to the panel RAM in a single
+    bulk SPI write, so callers can pass reusable buffers without copying.
     """
 
     # Subclasses must define these
@@ -58,7 +62,8 @@ class DisplayDriver:
         Display an image buffer.
 
         Args:
-            data: Image buffer (BUFFER_SIZE bytes, 1 bit per pixel)
+            data: Image buffer (BUFFER_SIZE bytes, 1 bit per pixel; any
+                buffer-protocol object)
             full: If True, use full refresh. If False, partial refresh.
             force_full: If True with full=False, force full refresh.
             stay_awake: Keep display powered after update.
@@ -71,6 +71,8 @@ class SSD1680(DisplayDriver):
         self._spi = spi
         self._state = DriverState()
         self._prev_buffer = bytearray(self.BUFFER_SIZE) if use_diff_buffer else None
+        self._frame_synced = False  # Panel shows _prev_buffer as-is
+        self._ram_lost = False  # Controller RAM dropped by a mode-2 sleep
 
     @classmethod
     def create(cls, use_diff_buffer: bool = True) -> "SSD1680":
@@ -249,11 +251,13 @@ class SSD1680(DisplayDriver):
 
         self._spi.write_command(CMD.CMD_RAM_BLACK, data)
         self._spi.write_command(CMD.CMD_RAM_RED, data)
+        self._ram_lost = False
         self._update(SEQ.SEQ_FULL)
 
         self._state.on_full_refresh_complete()
         if self._prev_buffer:
             self._prev_buffer[:] = data
+            self._frame_synced = True
 
         self.sleep()
 
@@ -268,7 +272,8 @@ class SSD1680(DisplayDriver):
         Display an image buffer.
 
         Args:
-            data: Image buffer (4736 bytes, 1 bit per pixel)
+            data: Image buffer (4736 bytes, 1 bit per pixel), any buffer-protocol
+                object; sent to RAM in one bulk write per plane
             full: If True, use full refresh. If False, partial.
             force_full: Force full refresh even when partial requested.
             stay_awake: Keep display powered after update.
@@ -303,6 +308,7 @@ class SSD1680(DisplayDriver):
 
         self._spi.write_command(CMD.CMD_RAM_BLACK, data)
         self._spi.write_command(CMD.CMD_RAM_RED, data)
+        self._ram_lost = False
 
         mode = SEQ.SEQ_CUSTOM_LUT if lut else SEQ.SEQ_FULL
         t = self._update(mode)
@@ -310,6 +316,7 @@ class SSD1680(DisplayDriver):
         self._state.on_full_refresh_complete()
         if self._prev_buffer:
             self._prev_buffer[:] = data
+            self._frame_synced = True
 
         if not stay_awake:
             self.sleep()
@@ -327,6 +334,13 @@ class SSD1680(DisplayDriver):
         if self._state.needs_full_refresh() or force_full:
             return self._display_full(data, lut=lut, stay_awake=stay_awake)
 
+        # Frame is byte-identical to what the panel shows: skip the refresh
+        # (and its BUSY wait) entirely, e.g. menu redraw after a no-op demo.
+        if lut is None and self._frame_synced and data == self._prev_buffer:
+            if not stay_awake:
+                self.sleep()
+            return 0.0
+
         self._init_partial()
         self._set_window(0, 0, self.WIDTH, self.HEIGHT)
 
@@ -337,12 +351,14 @@ class SSD1680(DisplayDriver):
         if self._prev_buffer:
             self._spi.write_command(CMD.CMD_RAM_RED, self._prev_buffer)
         self._spi.write_command(CMD.CMD_RAM_BLACK, data)
+        self._ram_lost = False
 
         mode = SEQ.SEQ_CUSTOM_LUT if lut else SEQ.SEQ_PARTIAL
         t = self._update(mode)
 
         if self._prev_buffer:
             self._prev_buffer[:] = data
+            self._frame_synced = True
         self._state.on_partial_refresh_complete()
 
         if not stay_awake:
@@ -373,11 +389,13 @@ class SSD1680(DisplayDriver):
 
         self._spi.write_command(CMD.CMD_RAM_BLACK, black)
         self._spi.write_command(CMD.CMD_RAM_RED, red if red else black)
+        self._ram_lost = False
 
         t = self._update(SEQ.SEQ_CUSTOM_LUT)
 
         # Custom LUT invalidates basemap
         self._state.has_basemap = False
+        self._frame_synced = False
         gc.collect()
         return t
 
@@ -408,44 +426,90 @@ class SSD1680(DisplayDriver):
         return self.display_regions([(data, x, y, w, h)])
 
     def display_regions(self, regions: list) -> float:
-        """Update multiple regions with a single refresh."""
+        """
+        Update multiple regions with a single refresh.
+
+        All CPU-side work (validation, window parameters, differential
+        old-data gather) is done up front, so the SPI loop below only
+        streams bytes and no region's marshalling delays the next transfer.
+        """
         if not self._state.has_basemap:
             raise RuntimeError("Must do full refresh first")
         if not regions:
             return 0.0
 
-        first = regions[0]
-        self._init_partial(first[1], first[2], first[3], first[4])
-
         stride = self.WIDTH // 8
-
-        for i, (data, x, y, w, h) in enumerate(regions):
+        prev = self._prev_buffer
+
+        # RAM was dropped in sleep: put the shown frame back in both RAMs
+        # first, or everything outside the regions refreshes from garbage
+        if self._ram_lost:
+            self._init_partial()
+            self._spi.write_command(CMD.CMD_RAM_RED, prev)
+            self._spi.write_command(CMD.CMD_RAM_BLACK, prev)
+            self._ram_lost = False
+        # Slice through memoryviews so row copies don't allocate temporaries
+        prev_mv = memoryview(prev) if prev else None
+
+        for i, (_, x, _, w, _) in enumerate(regions):
             if x & 7 or w & 7:
                 raise ValueError(f"Region {i}: x and w must be multiples of 8")
 
-            self._set_window(x, y, w, h)
-            x_byte = x // 8
-            w_byte = w // 8
-
-            # Write old data for differential update
-            if self._prev_buffer:
+        # Pass 1: marshal every region before touching the bus
+        jobs = []
+        for data, x, y, w, h in regions:
+            x_byte = x >> 3
+            w_byte = w >> 3
+            y_end = y + h - 1
+            y_lo_hi = (y & 0xFF, y >> 8)
+
+            # Gather old data for differential update, then update prev buffer
+            # (in region order, so overlapping regions see earlier writes)
+            old_data = None
+            if prev_mv is not None:
+                data_mv = memoryview(data)
                 old_data = bytearray(w_byte * h)
                 for row in range(h):
                     src = (y + row) * stride + x_byte
                     dst = row * w_byte
-                    old_data[dst:dst + w_byte] = self._prev_buffer[src:src + w_byte]
-                self._spi.write_command(CMD.CMD_RAM_RED, old_data)
-
-                # Update prev buffer
+                    old_data[dst:dst + w_byte] = prev_mv[src:src + w_byte]
                 for row in range(h):
                     dst = (y + row) * stride + x_byte
                     src = row * w_byte
-                    self._prev_buffer[dst:dst + w_byte] = data[src:src + w_byte]
+                    prev_mv[dst:dst + w_byte] = data_mv[src:src + w_byte]
+
+            jobs.append((
+                data, old_data, x_byte, y_lo_hi,
+                (x_byte, x_byte + w_byte - 1),
+                y_lo_hi + (y_end & 0xFF, y_end >> 8),
+            ))
 
-            # Reset counters and write new data
-            self._spi.write_command(CMD.CMD_RAM_X_CNT, x >> 3)
-            self._spi.write_command(CMD.CMD_RAM_Y_CNT, (y & 0xFF, y >> 8))
-            self._spi.write_command(CMD.CMD_RAM_BLACK, data)
+        first = regions[0]
+        self._init_partial(first[1], first[2], first[3], first[4])
+
+        # Pass 2: stream each region as one command burst (window setup,
+        # old data, counter reset, new data) under a single CS assertion
+        burst = self._spi.write_commands
+        for data, old_data, x_byte, y_cnt, x_win, y_win in jobs:
+            if old_data is not None:
+                burst((
+                    (CMD.CMD_RAM_X, x_win),
+                    (CMD.CMD_RAM_Y, y_win),
+                    (CMD.CMD_RAM_X_CNT, x_byte),
+                    (CMD.CMD_RAM_Y_CNT, y_cnt),
+                    (CMD.CMD_RAM_RED, old_data),
+                    (CMD.CMD_RAM_X_CNT, x_byte),
+                    (CMD.CMD_RAM_Y_CNT, y_cnt),
+                    (CMD.CMD_RAM_BLACK, data),
+                ))
+            else:
+                burst((
+                    (CMD.CMD_RAM_X, x_win),
+                    (CMD.CMD_RAM_Y, y_win),
+                    (CMD.CMD_RAM_X_CNT, x_byte),
+                    (CMD.CMD_RAM_Y_CNT, y_cnt),
+                    (CMD.CMD_RAM_BLACK, data),
+                ))
 
         t = self._update(SEQ.SEQ_PARTIAL)
         self._state.on_partial_refresh_complete()
@@ -457,7 +521,15 @@ class SSD1680(DisplayDriver):
     # =========================================================================
 
     def sleep(self, retain_ram: bool = True):
-        """Enter deep sleep mode."""
+        """
+        Enter deep sleep mode.
+
+        The panel image survives sleep either way (e-paper is bistable).
+        If controller RAM is dropped (retain_ram=False) but the diff buffer
+        is enabled, the basemap is kept: the next partial refresh re-uploads
+        the old frame from _prev_buffer (display_regions restores the whole
+        frame before its windows), so no full refresh is needed on wake.
+        """
         if self._state.is_sleeping:
             return
 
@@ -465,7 +537,9 @@ class SSD1680(DisplayDriver):
         mode = SEQ.SLEEP_MODE_1 if retain_ram else SEQ.SLEEP_MODE_2
         self._spi.write_command(CMD.CMD_DEEP_SLEEP, mode)
         time.sleep(0.001)
-        self._state.on_sleep(retain_ram)
+        if not retain_ram:
+            self._ram_lost = True
+        self._state.on_sleep(retain_ram or self._prev_buffer is not None)
 
     def wake(self):
         """Wake from deep sleep."""
@@ -503,15 +577,18 @@ class SSD1680(DisplayDriver):
 
         a = (0x80 if invert_red else 0x00) | (0x08 if invert_bw else 0x00)
         self._spi.write_command(CMD.CMD_UPDATE_CTRL1, (a, 0x80))
+        self._frame_synced = False  # Next refresh must redraw
 
     def fast_clear(self, color: int = 0xFF):
         """Hardware-accelerated clear using auto-fill."""
         self._init_full()
         self._auto_fill(color)
+        self._ram_lost = False
         self._update(SEQ.SEQ_FULL)
         self._state.on_full_refresh_complete()
         if self._prev_buffer:
             self._prev_buffer[:] = bytes([color]) * len(self._prev_buffer)
+            self._frame_synced = True
         self.sleep()
 
     def _auto_fill(self, pattern: int = 0xFF, red_ram: bool = True, bw_ram: bool = True):
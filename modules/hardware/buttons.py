@@ -26,9 +26,15 @@ Usage:
         print("Holding B")
 """
 
+import time
+
 import board
 import keypad
 
+# Idle time between queue checks in wait(). keypad scans in the background,
+# so sleeping here lets the MCU idle instead of spinning on an empty queue.
+_WAIT_POLL_S = 0.01
+
 
 class Buttons:
     """
@@ -63,6 +69,8 @@ class Buttons:
         )
         # Track logical state for is_pressed()
         self._state = [False] * self._COUNT
+        # Reused by wait() so the blocking loop doesn't allocate per poll
+        self._event = keypad.Event()
 
     def deinit(self):
         """Release button pins safely."""
@@ -111,22 +119,28 @@ class Buttons:
         """
         return self._state[button]
 
-    def wait(self, buttons: list = None) -> int:
+    def wait(self, buttons: list | tuple = None) -> int:
         """
         Blocking wait for a specific button press.
 
         Args:
-            buttons: List of button indices to wait for (default: any).
+            buttons: List or tuple of button indices to wait for (default: any).
+                Pass a module-level tuple in loops to avoid re-allocating.
 
         Returns:
             Index of the button that was pressed.
         """
+        events = self._keys.events
+        event = self._event
+
         # Clear old events to ensure we wait for a *new* press
-        self._keys.events.clear()
+        events.clear()
 
         while True:
-            event = self._keys.events.get()
-            if event and event.pressed:
+            if not events.get_into(event):
+                time.sleep(_WAIT_POLL_S)
+                continue
+            if event.pressed:
                 if buttons is None or event.key_number in buttons:
                     self._state[event.key_number] = True
                     return event.key_number
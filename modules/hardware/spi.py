@@ -178,9 +178,15 @@ class SPIDevice:
           - D/C LOW: Byte is a command
           - D/C HIGH: Bytes are data for the previous command
 
+        Command and data go out in a single CS-low transaction (only D/C
+        toggles between them), so a full framebuffer upload is one
+        contiguous spi.write() with no extra CS gap ahead of it.
+
         Args:
             cmd: Command byte (0x00-0xFF)
-            data: None, int, tuple of ints, or bytes/bytearray
+            data: None, int, tuple/list of ints, or any buffer-protocol object
+                (bytes, bytearray, memoryview, array); buffers go out as one
+                spi.write() without being copied
         """
         # Wait if display is busy before sending new command
         if self.busy.value:
@@ -189,31 +195,60 @@ class SPIDevice:
         while not self.spi.try_lock():
             pass
         try:
-            # Send command byte (D/C low)
-            self.dc.value = False
             self.cs.value = False
-            self._cmd_buf[0] = cmd
-            self.spi.write(self._cmd_buf)
+            self._send(cmd, data)
+        finally:
             self.cs.value = True
+            self.spi.unlock()
+
+    def write_commands(self, commands):
+        """
+        Send a sequence of commands in one burst.
+
+        Takes the bus lock and asserts CS once for the whole sequence, and
+        checks BUSY once up front, instead of per command. Use for runs of
+        register writes that don't trigger BUSY (RAM window setup, counters).
+
+        Args:
+            commands: Iterable of (cmd, data) pairs, data as for write_command()
+        """
+        if self.busy.value:
+            self.wait_ready()
 
-            # Send data bytes if provided (D/C high)
-            if data is not None:
-                self.dc.value = True
-                self.cs.value = False
-                if isinstance(data, int):
-                    self._data_buf[0] = data
-                    self.spi.write(memoryview(self._data_buf)[:1])
-                elif isinstance(data, (bytes, bytearray, memoryview)):
-                    self.spi.write(data)
-                else:
-                    # Tuple/list of ints
-                    for i, b in enumerate(data):
-                        self._data_buf[i] = b
-                    self.spi.write(memoryview(self._data_buf)[:len(data)])
-                self.cs.value = True
+        while not self.spi.try_lock():
+            pass
+        try:
+            self.cs.value = False
+            for cmd, data in commands:
+                self._send(cmd, data)
         finally:
+            self.cs.value = True
             self.spi.unlock()
 
+    def _send(self, cmd: int, data):
+        """Write one command byte and its data. Caller holds the lock and CS."""
+        spi = self.spi
+
+        # Send command byte (D/C low)
+        self.dc.value = False
+        self._cmd_buf[0] = cmd
+        spi.write(self._cmd_buf)
+
+        # Send data bytes if provided (D/C high, CS stays asserted)
+        if data is not None:
+            self.dc.value = True
+            if isinstance(data, int):
+                self._data_buf[0] = data
+                spi.write(memoryview(self._data_buf)[:1])
+            elif isinstance(data, (tuple, list)):
+                # Short parameter lists are staged in the scratch buffer
+                for i, b in enumerate(data):
+                    self._data_buf[i] = b
+                spi.write(memoryview(self._data_buf)[:len(data)])
+            else:
+                # Any buffer (frame data, LUTs): one bulk transfer
+                spi.write(data)
+
     def read_data(self, cmd: int, length: int = 1) -> bytes:
         """
         Read data from a display register.
@@ -5,7 +5,7 @@ Modules:
     bf2: BF2 font format parser
     renderer: Text renderer with multi-font support and caching
 """
-from .bf2 import BF2Font
+from .bf2 import BF2Font, clear_index_cache
 from .renderer import TextRenderer
 
-__all__ = ["BF2Font", "TextRenderer"]
+__all__ = ["BF2Font", "TextRenderer", "clear_index_cache"]
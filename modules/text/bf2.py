@@ -31,6 +31,16 @@ import struct
 _BF2_MAGIC = b"B2"
 _BF2_HEADER_SIZE = 12
 
+# Header fields + raw index per font path, shared across BF2Font instances so
+# reloading a font (load_font() on menu entry, add_font() patching) only
+# reopens the file instead of re-reading the index.
+_INDEX_CACHE = {}
+
+
+def clear_index_cache():
+    """Drop all cached font indexes (e.g. to reclaim RAM or after replacing a font file)."""
+    _INDEX_CACHE.clear()
+
 
 class BF2Font:
     """
@@ -39,6 +49,9 @@ class BF2Font:
     Keeps the font file open for on-demand glyph data reading.
     Use close() or context manager to release the file handle.
 
+    The header and raw index are cached per path at module level, so
+    opening the same font again skips re-reading them.
+
     Attributes:
         height: Glyph height in pixels
         max_w: Maximum glyph width in pixels
@@ -61,6 +74,13 @@ class BF2Font:
         """
         self.file = open(path, "rb")
 
+        cached = _INDEX_CACHE.get(path)
+        if cached is not None:
+            (self.max_w, self.height, self.count, self.bpr, self.def_w,
+             self.prop, self.entry_size, self._index) = cached
+            self._data_start = _BF2_HEADER_SIZE + self.count * self.entry_size
+            return
+
         # Validate magic
         if self.file.read(2) != _BF2_MAGIC:
             self.file.close()
@@ -75,17 +95,13 @@ class BF2Font:
         self.entry_size = 8 if (flags & 2) else 6
         self._data_start = _BF2_HEADER_SIZE + self.count * self.entry_size
 
-        # Load glyph index into memory for O(1) lookup
-        self.index = {}
-        idx_data = self.file.read(self.count * self.entry_size)
+        # Keep the raw index (sorted by codepoint) and binary-search it on
+        # lookup: loading is a single read, and RAM stays at entry_size bytes
+        # per glyph instead of a dict entry + tuple per glyph.
+        self._index = self.file.read(self.count * self.entry_size)
 
-        for i in range(self.count):
-            off = i * self.entry_size
-            if self.entry_size == 8:
-                cp, w, o0, o1, o2 = struct.unpack("<IBBBB", idx_data[off:off + 8])
-            else:
-                cp, w, o0, o1, o2 = struct.unpack("<HBBBB", idx_data[off:off + 6])
-            self.index[cp] = (w, o0 | (o1 << 8) | (o2 << 16))
+        _INDEX_CACHE[path] = (self.max_w, self.height, self.count, self.bpr,
+                              self.def_w, self.prop, self.entry_size, self._index)
 
     def get(self, cp: int):
         """
@@ -97,7 +113,23 @@ class BF2Font:
         Returns:
             (width, data_offset) tuple, or None if not found
         """
-        return self.index.get(cp)
+        idx = self._index
+        size = self.entry_size
+        fmt = "<I" if size == 8 else "<H"
+        lo = 0
+        hi = self.count
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            mid_cp = struct.unpack_from(fmt, idx, mid * size)[0]
+            if mid_cp < cp:
+                lo = mid + 1
+            elif mid_cp > cp:
+                hi = mid
+            else:
+                # Entry tail: width(1) + offset(3, little-endian)
+                o = mid * size + size - 4
+                return (idx[o], idx[o + 1] | (idx[o + 2] << 8) | (idx[o + 3] << 16))
+        return None
 
     def read(self, offset: int) -> bytes:
         """
@@ -20,11 +20,15 @@ try:
     from typing import TYPE_CHECKING
 except ImportError:
     TYPE_CHECKING = False
+import time
 import board
 import keypad
 
 _PINS = (board.BUTTON_A, board.BUTTON_B, board.BUTTON_C, board.BUTTON_D)  # type: ignore[attr-defined]
 
+# Idle time between queue checks in wait() (keypad scans in the background)
+_WAIT_POLL_S = 0.01
+
 
 class Buttons:
     """Handler for MagTag's 4 buttons using keypad module."""
@@ -36,6 +40,7 @@ class Buttons:
 
     def __init__(self) -> None:
         self._keys = keypad.Keys(_PINS, value_when_pressed=False, pull=True)
+        self._event = keypad.Event()  # Reused by wait()
 
     def __enter__(self) -> "Buttons":
         """Context manager entry."""
@@ -56,10 +61,17 @@ class Buttons:
         return event.key_number if event and event.pressed else None
 
     def wait(self, buttons: list[int] | None = None) -> int:
-        """Blocking wait for button press. Returns index 0-3."""
-        self._keys.events.clear()
+        """Blocking wait for button press. Returns index 0-3.
+
+        Sleeps between queue checks so the MCU idles instead of spinning.
+        """
+        events = self._keys.events
+        event = self._event
+        events.clear()
         while True:
-            event = self._keys.events.get()
-            if event and event.pressed:
+            if not events.get_into(event):
+                time.sleep(_WAIT_POLL_S)
+                continue
+            if event.pressed:
                 if buttons is None or event.key_number in buttons:
                     return event.key_number
@@ -230,6 +230,31 @@ class Canvas:
         """Measure text width without drawing."""
         return self._text.measure_width(string, scale)
 
+    def text_to_bitmap(self, string: str, scale: int = 1) -> tuple[bytes, int, int]:
+        """Render text once into a 1-bit bitmap for repeated blit().
+
+        For static labels drawn every frame: blit() of the cached bitmap
+        skips glyph lookup and per-pixel text rendering.
+
+        Returns:
+            (bitmap, w, h) - set bits are ink; w is padded to a multiple of 8
+        """
+        text = self._text
+        w = (text.measure_width(string, scale) + 7) & ~7
+        h = text.measure_height(scale)
+        scratch = FrameBuffer(w or 8, h)
+
+        # Point the renderer at the scratch buffer (shares font + glyph cache)
+        target = text._fb
+        text._fb = scratch
+        try:
+            text.draw(string, 0, 0, True, scale)
+        finally:
+            text._fb = target
+
+        scratch.invert()  # Ink is stored as cleared bits; blit wants set bits
+        return bytes(scratch.buffer), w, h
+
     def text_height(self, scale: int = 1) -> int:
         """Get font line height."""
         return self._text.measure_height(scale)
@@ -177,6 +177,18 @@ LUT_4GRAY = (
     b"\x24\x22\x22\x22\x23\x32\x00\x00\x00"  # FR, XON
 )
 
+# 2bpp -> 1bpp plane split tables for display_4gray(). Entry i holds the
+# high (black plane) or low (red plane) bits of the 4 pixels packed in
+# byte i, as a nibble, MSB first.
+_GRAY_PLANE_HI = bytes(
+    ((i >> 4) & 0x08) | ((i >> 3) & 0x04) | ((i >> 2) & 0x02) | ((i >> 1) & 0x01)
+    for i in range(256)
+)
+_GRAY_PLANE_LO = bytes(
+    ((i >> 3) & 0x08) | ((i >> 2) & 0x04) | ((i >> 1) & 0x02) | (i & 0x01)
+    for i in range(256)
+)
+
 # EPD state flags (bit flags for compact state tracking)
 _STATE_POWER_ON = 0x01          # Panel power is on
 _STATE_HIBERNATING = 0x02       # In deep sleep (needs HW reset)
@@ -220,6 +232,8 @@ class EPD:
 
         # Optional differential buffer for reduced ghosting (None = disabled)
         self._prev_buffer: bytearray | None = bytearray(self.BUFFER_SIZE) if use_diff_buffer else None
+        # True while _prev_buffer matches the whole panel (region updates break it)
+        self._prev_synced: bool = False
 
     def __enter__(self) -> "EPD":
         """Context manager entry."""
@@ -527,6 +541,7 @@ class EPD:
         # Sync differential buffer with cleared state (avoid per-byte loop)
         if self._prev_buffer:
             self._prev_buffer[:] = clear_data
+            self._prev_synced = True
 
         # Hibernate to preserve image if power is cut
         self.sleep()
@@ -575,6 +590,7 @@ class EPD:
         # Sync differential buffer with current display state
         if self._prev_buffer:
             self._prev_buffer[:] = data
+            self._prev_synced = True
 
         # Hibernate after full refresh to preserve image if power is cut
         self.sleep()
@@ -618,6 +634,11 @@ class EPD:
         if needs_full or force_full or threshold_exceeded:
             return self.display_full(data, lut=lut)
 
+        # Frame is byte-identical to what the panel shows: skip the refresh
+        # (and its BUSY wait) entirely, e.g. menu redraw after a no-op demo.
+        if lut is None and self._prev_synced and data == self._prev_buffer:
+            return 0.0
+
         self._init_partial()
 
         # Load custom LUT if provided
@@ -639,6 +660,7 @@ class EPD:
         # Store current frame as previous for next differential update
         if self._prev_buffer:
             self._prev_buffer[:] = data
+            self._prev_synced = True
 
         self._partial_count += 1
         gc.collect()
@@ -713,30 +735,15 @@ class EPD:
         ram_black = bytearray(data_len // 2)
         ram_red = bytearray(data_len // 2)
 
+        # One table lookup per input byte instead of a per-pixel bit loop
+        hi = _GRAY_PLANE_HI
+        lo = _GRAY_PLANE_LO
         out_idx = 0
         for i in range(0, data_len, 2):
             d1 = data[i]
             d2 = data[i + 1] if i + 1 < data_len else 0
-            black_byte = 0
-            red_byte = 0
-
-            # Process 4 pixels from d1
-            for _ in range(4):
-                pix = (d1 >> 6) & 0x03  # Get top 2 bits as 0-3
-                # High bit goes to RAM_BLACK, low bit goes to RAM_RED
-                black_byte = (black_byte << 1) | ((pix >> 1) & 1)
-                red_byte = (red_byte << 1) | (pix & 1)
-                d1 <<= 2
-
-            # Process 4 pixels from d2
-            for _ in range(4):
-                pix = (d2 >> 6) & 0x03
-                black_byte = (black_byte << 1) | ((pix >> 1) & 1)
-                red_byte = (red_byte << 1) | (pix & 1)
-                d2 <<= 2
-
-            ram_black[out_idx] = black_byte
-            ram_red[out_idx] = red_byte
+            ram_black[out_idx] = (hi[d1] << 4) | hi[d2]
+            ram_red[out_idx] = (lo[d1] << 4) | lo[d2]
             out_idx += 1
 
         return self.display_with_lut(LUT_4GRAY, ram_black, ram_red)
@@ -766,6 +773,7 @@ class EPD:
         self._write(CMD_RAM_BLACK, data)
         refresh_time = self._update(UPDATE_PARTIAL)
         self._partial_count += 1
+        self._prev_synced = False
         gc.collect()
         return refresh_time
 
@@ -802,6 +810,7 @@ class EPD:
 
         refresh_time = self._update(UPDATE_PARTIAL)
         self._partial_count += 1
+        self._prev_synced = False
         gc.collect()
         return refresh_time
 
@@ -100,6 +100,7 @@ class FrameBuffer:
         self._buffer_size = phys_width * phys_height // 8
         self._buffer: bytearray = bytearray(self._buffer_size)
         self._inverted = False  # Invert output when reading buffer
+        self._invert_mask = None  # All-ones big-int, built lazily by invert()
 
         # Calculate logical dimensions based on rotation
         self._update_dimensions()
@@ -145,10 +146,15 @@ class FrameBuffer:
 
         XORs all bytes in the buffer. Call again to restore original.
         When inverted, clear() and drawing operations automatically flip colors.
+
+        The XOR runs as one big-int operation against an all-ones mask
+        (built on first use and kept), instead of a per-byte Python loop.
         """
-        buf = self._buffer
-        for i in range(self._buffer_size):
-            buf[i] ^= 0xFF
+        n = self._buffer_size
+        mask = self._invert_mask
+        if mask is None:
+            mask = self._invert_mask = (1 << (n * 8)) - 1
+        self._buffer[:] = (int.from_bytes(self._buffer, "big") ^ mask).to_bytes(n, "big")
         self._inverted = not self._inverted
 
     def _effective_black(self, black: bool) -> bool:
@@ -317,16 +323,25 @@ class FrameBuffer:
             raise ValueError("px and pw must be multiples of 8")
 
         region_bytes = pw * ph // 8
-        region = bytearray(region_bytes)
         src_row_bytes = self._phys_width_bytes
         dst_row_bytes = pw // 8
         px_start = px // 8
 
+        # memoryview slices copy straight from the buffer; plain bytearray
+        # slicing would allocate a temporary for every row
+        src = memoryview(self._buffer)
+
+        # Full-width band is contiguous: single copy
+        if dst_row_bytes == src_row_bytes:
+            start = py * src_row_bytes
+            return bytearray(src[start:start + region_bytes])
+
+        region = bytearray(region_bytes)
         for row in range(ph):
             src_offset = (py + row) * src_row_bytes + px_start
             dst_offset = row * dst_row_bytes
             region[dst_offset:dst_offset + dst_row_bytes] = \
-                self._buffer[src_offset:src_offset + dst_row_bytes]
+                src[src_offset:src_offset + dst_row_bytes]
 
         return region
 